@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Iterable, Mapping, Set
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional, Set
 
 from django.core import checks
 from django.db import models
@@ -16,6 +16,57 @@ else:
     ModelMixinBase = object
 
 
+class LoadedValuesMixin(ModelMixinBase):
+    """
+    Lightweight replacement for `model_utils.FieldTracker` when only
+    the previous value of a few fields is needed.
+
+    Values of the `loaded_values_fields` are stored when the instance is
+    loaded from the database and after each save. Unlike FieldTracker it
+    doesn't wrap instance initialization and attribute access, so new
+    instances have no previous values and deferred fields are
+    considered as unchanged.
+
+    Note: Put this mixin before the model base class.
+    """
+    loaded_values_fields: Iterable[str] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._store_loaded_values()
+        return instance
+
+    def _store_loaded_values(self, fields: Optional[Iterable[str]] = None) -> None:
+        loaded_values = self.__dict__.setdefault('_loaded_values', {})
+        for field_name in self.loaded_values_fields:
+            if fields is not None and field_name not in fields:
+                continue
+            attname = self._meta.get_field(field_name).attname
+            if attname in self.__dict__:
+                loaded_values[field_name] = self.__dict__[attname]
+
+    def get_loaded_value(self, field_name: str) -> Any:
+        """Returns value of the field as it was loaded from the database"""
+        return self.__dict__.get('_loaded_values', {}).get(field_name)
+
+    def has_field_changed(self, field_name: str) -> bool:
+        loaded_values = self.__dict__.get('_loaded_values', {})
+        if field_name not in loaded_values and not self._state.adding:
+            # Deferred field
+            return False
+        current_value = getattr(self, self._meta.get_field(field_name).attname)
+        return loaded_values.get(field_name) != current_value
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._store_loaded_values(kwargs.get('update_fields'))
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._store_loaded_values(kwargs.get('fields'))
+
+
 class DerivableFieldsMixin(ModelMixinBase):
     """
     Before computing derivable field value make sure that any data this
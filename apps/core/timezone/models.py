@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, ClassVar, List, Optional, Type, cast
 from django.core import checks
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.utils.functional import cached_property
 
 __all__ = ['TimezoneAwareMixin']
 
@@ -23,6 +24,14 @@ class TimezoneAwareMixin(ModelMixinBase):
             return related_field.get_timezone()
         return related_field
 
+    @cached_property
+    def _tz(self) -> Optional[tzinfo]:
+        """
+        Time zone cached on the instance. Use it to localize several
+        datetime fields without resolving the related objects chain again.
+        """
+        return self.get_timezone()
+
     @classmethod
     def check(cls, **kwargs):
         errors = super().check(**kwargs)
@@ -199,6 +199,9 @@ class StudentAssignmentAdmin(BaseModelAdmin):
     exclude = ['watchers']
     inlines = [StudentAssignmentWatcherInlineAdmin, AssignmentScoreAuditLogAdminInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_assignment_score()
+
     class Media:
         css = {
             'all': ('v1/css/admin/no_inline_form_titles.css',)
@@ -211,8 +214,8 @@ class StudentAssignmentAdmin(BaseModelAdmin):
             return ['score_changed', 'state_display']
 
     def save_model(self, request, obj, form, change):
-        is_score_has_changed = obj.tracker.has_changed('score') or (not change and obj.score is not None)
-        score_old = obj.tracker.previous('score')
+        is_score_has_changed = obj.has_field_changed('score') or (not change and obj.score is not None)
+        score_old = obj.get_loaded_value('score')
         # Save object with an old score, then upgrade it with a new score value
         score_new = obj.score
         obj.score = score_old
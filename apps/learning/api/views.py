@@ -166,7 +166,7 @@ class StudentAssignmentUpdate(UpdateAPIView):
     def get_queryset(self):
         return (StudentAssignment.objects
                 .filter(assignment_id=self.kwargs['assignment_id'])
-                .select_related('assignment')
+                .with_assignment_score()
                 .order_by())
 
 
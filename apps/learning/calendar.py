@@ -34,7 +34,8 @@ def get_teacher_calendar_events(*, user, start_date,
 
 def get_all_calendar_events(*, program_list, start_date, end_date, time_zone):
     """
-    Returns events in a given date range for a given program list.
+    Returns events in a given date range for a given list of programs
+    or their ids.
     """
     period_filter = _to_range_q_filter(start_date, end_date)
     for c in get_classes(period_filter).in_programs(program_list):
@@ -168,6 +168,8 @@ def gradebook_data(course: Course, student_group: Optional[int] = None) -> Grade
     if student_group is not None:
         course_enrollments = course_enrollments.filter(student_group=student_group)
     enrollments = (course_enrollments
+                   .for_gradebook()
+                   .with_grading_system()
                    .select_related("student",
                                    "student_profile__invitation",
                                    "student_group")
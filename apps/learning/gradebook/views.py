@@ -363,7 +363,11 @@ class ImportCourseGradesBaseView(PermissionRequiredMixin, generic.View):
 
 class ImportCourseGradesByEnrollmentIDView(ImportCourseGradesBaseView):
     def _import_grades(self, course: Course, csv_file: IO):
-        enrollments = {str(e.pk): e for e in Enrollment.active.filter(course=course)}
+        enrollments = (Enrollment.active
+                       .filter(course=course)
+                       .for_gradebook()
+                       .with_grading_system())
+        enrollments = {str(e.pk): e for e in enrollments}
         return enrollment_import_grades_from_csv(csv_file,
                                                  course=course,
                                                  enrollments=enrollments,
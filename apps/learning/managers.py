@@ -23,6 +23,13 @@ class StudentAssignmentQuerySet(query.QuerySet):
         """
         return self.filter(assignment__deadline_at__gt=timezone.now())
 
+    def with_assignment_score(self):
+        """
+        Fetches assignment in the same query since its maximum score is
+        used to validate personal assignment score.
+        """
+        return self.select_related('assignment')
+
 
 class _StudentAssignmentDefaultManager(LiveManager):
     """On compsciclub.ru always restrict by open readings"""
@@ -52,7 +59,21 @@ class _EnrollmentActiveManager(models.Manager):
 
 
 class EnrollmentQuerySet(models.QuerySet):
-    pass
+    def with_grading_system(self):
+        """
+        Fetches course program binding in the same query since it's used
+        to display enrollment grade.
+        """
+        return self.select_related('course_program_binding')
+
+    def for_gradebook(self):
+        """
+        Loads only the fields used by the gradebook, e.g. skips text
+        fields with the reasons of entering/leaving the course.
+        """
+        return self.only('pk', 'student', 'student_profile', 'course',
+                         'course_program_binding', 'grade', 'grade_changed',
+                         'student_group')
 
 
 EnrollmentDefaultManager = _EnrollmentDefaultManager.from_queryset(
@@ -62,7 +83,12 @@ EnrollmentActiveManager = _EnrollmentActiveManager.from_queryset(
 
 
 class AssignmentCommentQuerySet(models.QuerySet):
-    pass
+    def with_upload_context(self):
+        """
+        Fetches related objects required to compute the upload path of
+        the attached file. Use it when saving attachments in a loop.
+        """
+        return self.select_related('student_assignment__assignment__course__semester')
 
 
 class _AssignmentCommentPublishedManager(LiveManager):
@@ -70,5 +96,7 @@ class _AssignmentCommentPublishedManager(LiveManager):
         return super().get_queryset().filter(is_published=True)
 
 
+AssignmentCommentDefaultManager = LiveManager.from_queryset(
+    AssignmentCommentQuerySet)
 AssignmentCommentPublishedManager = _AssignmentCommentPublishedManager.from_queryset(
     AssignmentCommentQuerySet)
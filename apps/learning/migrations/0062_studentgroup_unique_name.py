@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-15 06:29
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0031_delete_branch"),
+        ("courses", "0068_delete_coursebranch"),
+        ("learning", "0061_remove_event_branch"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="studentgroup",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                models.F("course"),
+                condition=models.Q(
+                    ("program__isnull", True), ("program_run__isnull", True)
+                ),
+                name="unique_student_group_name_per_course",
+                violation_error_message="A student group with the same name already exists in the course",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="studentgroup",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                models.F("course"),
+                models.F("program"),
+                condition=models.Q(("program__isnull", False)),
+                name="unique_student_group_name_per_course_program",
+                violation_error_message="A student group with the same name already exists in the course",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="studentgroup",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                models.F("course"),
+                models.F("program_run"),
+                condition=models.Q(("program_run__isnull", False)),
+                name="unique_student_group_name_per_course_program_run",
+                violation_error_message="A student group with the same name already exists in the course",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-15 06:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("learning", "0062_studentgroup_unique_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignmentcomment",
+            index=models.Index(
+                fields=["student_assignment", "author"],
+                name="assignment_comment_author_idx",
+            ),
+        ),
+    ]
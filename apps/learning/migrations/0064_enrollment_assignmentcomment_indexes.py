@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0068_delete_coursebranch"),
+        ("learning", "0063_assignmentcomment_author_idx"),
+        (
+            "users",
+            "0069_remove_studentprofile_unique_regular_student_per_admission_campaign_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignmentcomment",
+            index=models.Index(
+                fields=["student_assignment", "type"],
+                name="assignment_comment_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="enrollment",
+            index=models.Index(
+                fields=["course", "is_deleted"], name="enrollment_course_active_idx"
+            ),
+        ),
+    ]
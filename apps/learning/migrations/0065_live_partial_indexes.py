@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0068_delete_coursebranch"),
+        ("learning", "0064_enrollment_assignmentcomment_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="assignmentcomment",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["student_assignment"],
+                name="assignment_comment_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studentassignment",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["assignment", "student"],
+                name="student_assignment_live_idx",
+            ),
+        ),
+    ]
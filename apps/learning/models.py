@@ -1,29 +1,34 @@
+import base64
 import datetime
 import logging
 import os
 import os.path
 from decimal import Decimal
+from functools import lru_cache, partial
 from secrets import token_urlsafe
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
 
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
-from django.db.models import Q, Sum
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, Q, Sum, Value, When, prefetch_related_objects
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.encoding import smart_str
+from django.utils.functional import cached_property
+from django.utils.http import RFC3986_SUBDELIMS
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from djchoices import C, DjangoChoices
-from model_utils import FieldTracker
 from model_utils.fields import MonitorField
 from model_utils.managers import QueryManager
 from model_utils.models import TimeStampedModel
 from rest_framework.utils.encoders import JSONEncoder
 
 from core.db.fields import ScoreField
-from core.db.mixins import DerivableFieldsMixin
+from core.db.mixins import DerivableFieldsMixin, LoadedValuesMixin
 from core.db.models import SoftDeletionModel
 from core.models import LATEX_MARKDOWN_HTML_ENABLED, Location, TimestampedModel, AcademicProgram, \
     AcademicProgramRun
@@ -35,7 +40,7 @@ from courses.models import Assignment, Course, CourseNews, Semester, StudentGrou
     CourseProgramBinding
 from files.models import ConfigurableStorageFileField
 from learning.managers import (
-    AssignmentCommentPublishedManager, EnrollmentActiveManager,
+    AssignmentCommentDefaultManager, AssignmentCommentPublishedManager, EnrollmentActiveManager,
     EnrollmentDefaultManager, EventQuerySet,
     StudentAssignmentManager
 )
@@ -47,6 +52,26 @@ from users.models import StudentProfile
 
 logger = logging.getLogger(__name__)
 
+_STATUS_CSS_CLASS = {
+    AssignmentStatus.NOT_SUBMITTED.value: "not-submitted",
+    AssignmentStatus.ON_CHECKING.value: "on-checking",
+    AssignmentStatus.NEED_FIXES.value: "need-fixes",
+    AssignmentStatus.COMPLETED.value: "completed"
+}
+
+def _generate_urlsafe_tokens(count: int, nbytes: int) -> List[str]:
+    """
+    Returns *count* random URL-safe text strings, each contains *nbytes*
+    random bytes. Same as calling `secrets.token_urlsafe(nbytes)` *count*
+    times but reads random bytes from the OS at once.
+    """
+    random_bytes = memoryview(os.urandom(count * nbytes))
+    return [base64.urlsafe_b64encode(random_bytes[i:i + nbytes]).rstrip(b'=').decode('ascii')
+            for i in range(0, count * nbytes, nbytes)]
+
+
+_STUDENT_GROUP_NOT_UNIQUE_NAME = _("A student group with the same name already exists in the course")
+
 
 # FIXME: add constraint: 1 system group per course
 class StudentGroup(TimeStampedModel):
@@ -85,16 +110,58 @@ class StudentGroup(TimeStampedModel):
     class Meta:
         verbose_name = _("Student Group")
         verbose_name_plural = _("Student Groups")
+        # Case-insensitive name uniqueness. Nullable `program` and
+        # `program_run` are mutually exclusive, split constraints by
+        # condition since NULL values are always distinct in unique index.
+        constraints = [
+            models.UniqueConstraint(
+                Lower('name'), 'course',
+                condition=Q(program__isnull=True, program_run__isnull=True),
+                name='unique_student_group_name_per_course',
+                violation_error_message=_STUDENT_GROUP_NOT_UNIQUE_NAME),
+            models.UniqueConstraint(
+                Lower('name'), 'course', 'program',
+                condition=Q(program__isnull=False),
+                name='unique_student_group_name_per_course_program',
+                violation_error_message=_STUDENT_GROUP_NOT_UNIQUE_NAME),
+            models.UniqueConstraint(
+                Lower('name'), 'course', 'program_run',
+                condition=Q(program_run__isnull=False),
+                name='unique_student_group_name_per_course_program_run',
+                violation_error_message=_STUDENT_GROUP_NOT_UNIQUE_NAME),
+        ]
 
     def __str__(self):
         return self.name
 
-    def save(self, **kwargs):
+    def save(self, *, validate=False, **kwargs):
         created = self.pk is None
         if created and not self.enrollment_key:
             self.enrollment_key = token_urlsafe(18)  # 24 chars in base64
-        self.full_clean()  # enforce validation on .get_or_create() calls
-        super().save(**kwargs)
+        if validate:
+            self.full_clean()
+        try:
+            with transaction.atomic():
+                super().save(**kwargs)
+        except IntegrityError as e:
+            constraint_names = (c.name for c in self._meta.constraints)
+            if any(name in str(e) for name in constraint_names):
+                raise ValidationError(_STUDENT_GROUP_NOT_UNIQUE_NAME,
+                                      code='unique') from e
+            raise
+
+    @classmethod
+    def bulk_create_with_enrollment_keys(cls, student_groups: List["StudentGroup"],
+                                         batch_size: int = 1000) -> List["StudentGroup"]:
+        """
+        Generates missing enrollment keys and saves new student groups
+        with a single insert query per batch.
+        Note: validation is not called on this path.
+        """
+        without_key = [sg for sg in student_groups if not sg.enrollment_key]
+        for sg, key in zip(without_key, _generate_urlsafe_tokens(len(without_key), 18)):
+            sg.enrollment_key = key
+        return cls.objects.bulk_create(student_groups, batch_size=batch_size)
 
     def clean(self):
         if self.type == StudentGroupTypes.PROGRAM and not self.program_id:
@@ -107,16 +174,6 @@ class StudentGroup(TimeStampedModel):
         if sum(getattr(self, field_name, None) is not None for field_name in mutually_exclusive) > 1:
             msg = _(f"Fields {mutually_exclusive} are mutually exclusive")
             raise ValidationError(msg, code='malformed')
-        if self.course_id and self.name:
-            the_same_name = (StudentGroup.objects
-                             .exclude(pk=self.pk)
-                             .filter(name__iexact=self.name,
-                                     program_id=self.program_id,
-                                     program_run_id=self.program_run_id,
-                                     course_id=self.course_id))
-            if the_same_name.exists():
-                msg = _("A student group with the same name already exists in the course")
-                raise ValidationError(msg, code='unique')
 
     def get_absolute_url(self):
         return reverse("teaching:student_groups:detail", kwargs={
@@ -261,6 +318,12 @@ class CourseClassGroup(models.Model):
 
 
 class Enrollment(TimezoneAwareMixin, TimeStampedModel):
+    """
+    Grade related properties (`grade_display`, `grade_css_class`,
+    `grade_choices`) depend on the course program binding. Use
+    `.with_grading_system()` queryset method when iterating over
+    enrollments to avoid fetching the binding for each row.
+    """
     TIMEZONE_AWARE_FIELD_NAME = 'course'
 
     student = models.ForeignKey(
@@ -311,6 +374,10 @@ class Enrollment(TimezoneAwareMixin, TimeStampedModel):
         unique_together = [('student', 'course')]
         verbose_name = _("Enrollment")
         verbose_name_plural = _("Enrollments")
+        indexes = [
+            models.Index(fields=['course', 'is_deleted'],
+                         name='enrollment_course_active_idx'),
+        ]
 
     def __str__(self):
         return "{0} - {1}".format(smart_str(self.course),
@@ -335,22 +402,90 @@ class Enrollment(TimezoneAwareMixin, TimeStampedModel):
             raise ValidationError("Course program binding doesn't match the student's program")
         if (
             (binding_invitation_id := self.course_program_binding.invitation_id)
-            and not self.student_profile.invitations.filter(id=binding_invitation_id).exists()
+            and not self._student_has_invitation(binding_invitation_id)
         ):
             raise ValidationError("Student profile doesn't have the invitation from the binding")
 
+    def _student_has_invitation(self, invitation_id: int) -> bool:
+        student_profile = self.student_profile
+        if 'invitations' in getattr(student_profile, '_prefetched_objects_cache', {}):
+            return any(i.pk == invitation_id for i in student_profile.invitations.all())
+        return student_profile.invitations.filter(id=invitation_id).exists()
+
+    @classmethod
+    def clean_bulk(cls, enrollments: List["Enrollment"]) -> None:
+        """
+        Calls `.clean()` on each enrollment. Related objects used in
+        validation are fetched beforehand with a constant number of queries.
+        Raises ValidationError with all the collected errors.
+        """
+        prefetch_related_objects(enrollments,
+                                 'course_program_binding',
+                                 'student_group',
+                                 'student_profile__academic_program_enrollment',
+                                 'student_profile__invitations')
+        errors = []
+        for enrollment in enrollments:
+            try:
+                enrollment.clean()
+            except ValidationError as e:
+                errors.append(e)
+        if errors:
+            raise ValidationError(errors)
+
+    @classmethod
+    def bulk_update_grades(cls, changes: Iterable[Tuple[int, int, int, str]]) -> int:
+        """
+        Sets final grades for many enrollments with a single UPDATE query
+        and logs them in the grade history. Each change is a tuple of
+        (enrollment_id, grade, author_id, source).
+
+        Note: Permission checks and conflict detection are not performed,
+        see `update_enrollment_grade` for a single grade update.
+        Returns the number of updated enrollments.
+        """
+        changes = list(changes)
+        if not changes:
+            return 0
+        grades = {enrollment_id: grade for enrollment_id, grade, *_ in changes}
+        changed_at = timezone.now()
+        new_grade = Case(*(When(pk=enrollment_id, then=Value(grade))
+                           for enrollment_id, grade in grades.items()),
+                         output_field=models.SmallIntegerField())
+        log_entries = [EnrollmentGradeLog(enrollment_id=enrollment_id,
+                                          grade=grade,
+                                          entry_author_id=author_id,
+                                          source=source,
+                                          grade_changed_at=changed_at)
+                       for enrollment_id, grade, author_id, source in changes]
+        with transaction.atomic():
+            # Queryset update bypasses MonitorField, set `grade_changed` manually
+            updated = (cls.objects
+                       .filter(pk__in=grades)
+                       .update(grade=new_grade, grade_changed=changed_at))
+            EnrollmentGradeLog.objects.bulk_create(log_entries, batch_size=1000)
+        return updated
+
     def grade_changed_local(self, tz=None):
         if not tz:
-            tz = self.get_timezone()
+            tz = self._tz
         return timezone.localtime(self.grade_changed, timezone=tz)
 
+    @cached_property
+    def _grading_system_num(self) -> int:
+        return self.course_program_binding.grading_system_num
+
+    @cached_property
+    def _grading_system(self):
+        return GradingSystems.get_choice(self._grading_system_num)
+
     @property
     def grade_display(self):
-        return GradeTypes.get_display_grade(self.course_program_binding.grading_system_num, self.grade)
+        return GradeTypes.get_display_grade(self._grading_system_num, self.grade)
 
     @property
     def grade_css_class(self):
-        grading_system = self.course_program_binding.grading_system
+        grading_system = self._grading_system
         if self.grade in (GradeTypes.NOT_GRADED, GradeTypes.RE_CREDIT):
             return ''
         if self.grade >= grading_system.excellent_from:
@@ -367,7 +502,7 @@ class Enrollment(TimezoneAwareMixin, TimeStampedModel):
 
     @property
     def grade_choices(self):
-        return GradeTypes.get_choices_for_grading_system(self.course_program_binding.grading_system_num)
+        return GradeTypes.get_choices_for_grading_system(self._grading_system_num)
 
 
 class EnrollmentGradeLog(TimestampedModel):
@@ -437,6 +572,18 @@ class Invitation(TimeStampedModel):
             self.token = token_urlsafe(48)  # 64 chars in base64
         super().save(**kwargs)
 
+    @classmethod
+    def bulk_create_with_tokens(cls, invitations: List["Invitation"],
+                                batch_size: int = 1000) -> List["Invitation"]:
+        """
+        Generates missing tokens and saves new invitations with a single
+        insert query per batch.
+        """
+        without_token = [i for i in invitations if not i.token]
+        for invitation, token in zip(without_token, _generate_urlsafe_tokens(len(without_token), 48)):
+            invitation.token = token
+        return cls.objects.bulk_create(invitations, batch_size=batch_size)
+
     def get_absolute_url(self):
         return reverse("invitation", kwargs={"token": self.token})
 
@@ -447,8 +594,32 @@ class PersonalAssignmentActivity(models.TextChoices):
     SOLUTION = 'ns'
 
 
-class StudentAssignment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel,
-                        DerivableFieldsMixin):
+def _parse_stats(meta) -> Optional[Dict[str, Any]]:
+    """
+    Converts personal assignment stats stored in the `meta` json field
+    to python objects.
+    """
+    if meta is None or not isinstance(meta, dict) or 'stats' not in meta:
+        return None
+    stats = {}
+    for key, value in meta['stats'].items():
+        if key == 'solutions':
+            solution_stats = {}
+            for k, v in value.items():
+                if k == 'first' or k == 'last':
+                    # TODO: use drf serializer since we use JSONEncoder
+                    #  from this lib
+                    v = datetime.datetime.fromisoformat(v.replace('Z', '+00:00'))
+                solution_stats[k] = v
+            if 'last' not in solution_stats:
+                solution_stats['last'] = solution_stats['first']
+            value = solution_stats
+        stats[key] = value
+    return stats
+
+
+class StudentAssignment(LoadedValuesMixin, SoftDeletionModel, TimezoneAwareMixin,
+                        TimeStampedModel, DerivableFieldsMixin):
     TIMEZONE_AWARE_FIELD_NAME = 'assignment'
 
     assignment = models.ForeignKey(
@@ -508,7 +679,7 @@ class StudentAssignment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel,
 
     objects = StudentAssignmentManager()
 
-    tracker = FieldTracker(fields=['score'])
+    loaded_values_fields = ['score']
 
     derivable_fields = ['execution_time']
 
@@ -517,8 +688,20 @@ class StudentAssignment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel,
         verbose_name = _("Personal Assignment")
         verbose_name_plural = _("Personal Assignments")
         unique_together = [['assignment', 'student']]
+        # Live rows only, soft-deleted records are filtered out by
+        # the default manager
+        indexes = [
+            models.Index(fields=['assignment', 'student'],
+                         condition=Q(deleted_at__isnull=True),
+                         name='student_assignment_live_idx'),
+        ]
 
     def clean(self):
+        if (settings.DEBUG and self.score
+                and not StudentAssignment.assignment.is_cached(self)):
+            logger.warning("Personal assignment %s is fetched without related "
+                           "assignment, use .with_assignment_score() to avoid "
+                           "extra queries on validation", self.pk)
         if self.score and self.score > self.assignment.maximum_score:
             raise ValidationError(_("Grade can't be larger than maximum "
                                     "one ({0})")
@@ -528,17 +711,47 @@ class StudentAssignment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel,
         return "{0} - {1}".format(smart_str(self.assignment),
                                   smart_str(self.student.get_full_name()))
 
-    def _compute_execution_time(self):
+    @staticmethod
+    def _get_execution_time_totals(student_assignments) -> Dict[int, datetime.timedelta]:
+        """
+        Returns total execution time of solutions for each personal
+        assignment in one grouped query.
+        """
         time_spent = (AssignmentComment.objects
                       .filter(type=AssignmentSubmissionTypes.SOLUTION,
-                              student_assignment=self)
-                      .aggregate(total=Sum('execution_time')))
-        execution_time = time_spent['total']  # Could be None
+                              student_assignment__in=student_assignments)
+                      .order_by()
+                      .values('student_assignment_id')
+                      .annotate(total=Sum('execution_time'))
+                      .values_list('student_assignment_id', 'total'))
+        return dict(time_spent)
+
+    def _compute_execution_time(self):
+        time_spent = self._get_execution_time_totals([self.pk])
+        execution_time = time_spent.get(self.pk)  # Could be None
         if self.execution_time != execution_time:
             self.execution_time = execution_time
             return True
         return False
 
+    @classmethod
+    def recompute_execution_time_bulk(cls, queryset) -> int:
+        """
+        Recalculates `execution_time` for all personal assignments in
+        the queryset, e.g. for the whole course, without issuing
+        an aggregate query per personal assignment.
+        Returns the number of updated records.
+        """
+        time_spent = cls._get_execution_time_totals(queryset.values('pk'))
+        changed = []
+        for student_assignment in queryset.only('pk', 'execution_time'):
+            execution_time = time_spent.get(student_assignment.pk)
+            if student_assignment.execution_time != execution_time:
+                student_assignment.execution_time = execution_time
+                changed.append(student_assignment)
+        cls.objects.bulk_update(changed, ['execution_time'], batch_size=1000)
+        return len(changed)
+
     def get_teacher_url(self):
         return reverse('teaching:student_assignment_detail',
                        kwargs={"pk": self.pk})
@@ -553,30 +766,18 @@ class StudentAssignment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel,
         return self.pk in cache.assignments
 
     def has_comments(self, user):
-        return any(c.author_id == user.pk for c in
-                   self.assignmentcomment_set(manager='published').all())
+        return (self.assignmentcomment_set(manager='published')
+                .filter(author_id=user.pk)
+                .exists())
 
-    # TODO -> @cached_property
-    @property
+    @cached_property
     def stats(self) -> Optional[Dict[str, Any]]:
-        if (self.meta is None or not isinstance(self.meta, dict) or
-            'stats' not in self.meta):
-            return None
-        stats = {}
-        for key, value in self.meta['stats'].items():
-            if key == 'solutions':
-                solution_stats = {}
-                for k, v in value.items():
-                    if k == 'first' or k == 'last':
-                        # TODO: use drf serializer since we use JSONEncoder
-                        #  from this lib
-                        v = datetime.datetime.fromisoformat(v.replace('Z', '+00:00'))
-                    solution_stats[k] = v
-                if 'last' not in solution_stats:
-                    solution_stats['last'] = solution_stats['first']
-                value = solution_stats
-            stats[key] = value
-        return stats
+        return _parse_stats(self.meta)
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        # Parsed value depends on the `meta` field
+        self.__dict__.pop('stats', None)
 
     @property
     def is_submission_received(self):
@@ -615,12 +816,7 @@ class StudentAssignment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel,
 
     @property
     def status_css_class(self) -> str:
-        return {
-            AssignmentStatus.NOT_SUBMITTED.value: "not-submitted",
-            AssignmentStatus.ON_CHECKING.value: "on-checking",
-            AssignmentStatus.NEED_FIXES.value: "need-fixes",
-            AssignmentStatus.COMPLETED.value: "completed"
-        }.get(self.status, "")
+        return _STATUS_CSS_CLASS.get(self.status, "")
 
     @property
     def final_score(self) -> Optional[Decimal]:
@@ -691,6 +887,10 @@ class AssignmentScoreAuditLog(TimestampedModel):
 def assignment_comment_attachment_upload_to(self: "AssignmentComment",
                                             filename) -> str:
     sa = self.student_assignment
+    if settings.DEBUG and not StudentAssignment.assignment.is_cached(sa):
+        logger.warning("Personal assignment %s is fetched without related "
+                       "assignment, use .with_upload_context() to avoid "
+                       "extra queries on saving attachments", sa.pk)
     semester_slug = sa.assignment.course.semester.slug
     return f'assignments/{semester_slug}/{sa.assignment_id}/user_{sa.student_id}/{filename}'
 
@@ -700,7 +900,8 @@ class AssignmentSubmissionTypes(DjangoChoices):
     SOLUTION = C('solution', _("Solution"))
 
 
-class AssignmentComment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel):
+class AssignmentComment(LoadedValuesMixin, SoftDeletionModel, TimezoneAwareMixin,
+                        TimeStampedModel):
     TIMEZONE_AWARE_FIELD_NAME = 'student_assignment'
 
     student_assignment = models.ForeignKey(
@@ -738,14 +939,25 @@ class AssignmentComment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel)
         blank=True, null=True,
         editable=False)
 
-    tracker = FieldTracker(fields=['is_published'])
+    loaded_values_fields = ['is_published', 'type', 'execution_time']
 
     published = AssignmentCommentPublishedManager()
+    # Keep `published` as the default manager
+    objects = AssignmentCommentDefaultManager()
 
     class Meta:
         ordering = ["created"]
         verbose_name = _("Assignment-comment")
         verbose_name_plural = _("Assignment-comments")
+        indexes = [
+            models.Index(fields=['student_assignment', 'author'],
+                         name='assignment_comment_author_idx'),
+            models.Index(fields=['student_assignment', 'type'],
+                         name='assignment_comment_type_idx'),
+            models.Index(fields=['student_assignment'],
+                         condition=Q(deleted_at__isnull=True),
+                         name='assignment_comment_live_idx'),
+        ]
 
     def __str__(self):
         return ("Comment to {0} by {1}".format(
@@ -753,27 +965,28 @@ class AssignmentComment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel)
             smart_str(self.student_assignment.student.get_full_name())))
 
     def save(self, **kwargs):
-        from learning.services.notification_service import generate_notifications_about_new_submission
-        from learning.services.personal_assignment_service import maybe_set_assignee_for_personal_assignment
         created = self.pk is None
-        is_published_before = bool(self.tracker.previous('is_published'))
+        is_published_before = bool(self.get_loaded_value('is_published'))
         super().save(**kwargs)
+        # File name could be changed by the storage on save
+        self.__dict__.pop('attached_file_name', None)
         # FIXME: move this logic to create_assignment_comment/create_assignment_solution
         has_been_published = self.is_published and (created or
                                                     not is_published_before)
         # Send notifications on publishing submission
         if has_been_published:
-            maybe_set_assignee_for_personal_assignment(self.pk)
-            generate_notifications_about_new_submission(self)
+            from learning.tasks import handle_published_assignment_submission
+            transaction.on_commit(partial(handle_published_assignment_submission.delay,
+                                          submission_id=self.pk))
 
     def created_local(self, tz=None):
         if not tz:
-            tz = self.get_timezone()
+            tz = self._tz
         return timezone.localtime(self.created, timezone=tz)
 
     def modified_local(self, tz=None):
         if not tz:
-            tz = self.get_timezone()
+            tz = self._tz
         return timezone.localtime(self.modified, timezone=tz)
 
     def get_update_url(self):
@@ -782,9 +995,14 @@ class AssignmentComment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel)
             "comment_pk": self.pk
         })
 
-    @property
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.__dict__.pop('attached_file_name', None)
+
+    @cached_property
     def attached_file_name(self):
-        return os.path.basename(self.attached_file.name)
+        # Upload path is built by `upload_to`, it's always `/`-separated
+        return self.attached_file.name.rpartition('/')[2]
 
     def get_attachment_download_url(self):
         return reverse("study:download_assignment_comment_attachment", kwargs={
@@ -801,9 +1019,9 @@ class AssignmentComment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel)
         td: Optional[datetime.timedelta] = self.execution_time
         if td is None:
             return "-:-"
-        mm, _ = divmod(td.seconds, 60)
-        hh, mm = divmod(mm, 60)
-        s = "%d:%02d" % (hh, mm)
+        # Days are displayed separately, `td.seconds` is less than a day
+        hh, mm = divmod(td.seconds // 60, 60)
+        s = f"{hh}:{mm:02d}"
         if td.days:
             # TODO: pluralize, add i18n
             return f"{td.days} д. {s}"
@@ -816,11 +1034,52 @@ class AssignmentComment(SoftDeletionModel, TimezoneAwareMixin, TimeStampedModel)
             return self.author.get_full_name()
 
 
+def _get_cached_semester_slug(student_assignment: StudentAssignment) -> Optional[str]:
+    if not StudentAssignment.assignment.is_cached(student_assignment):
+        return None
+    assignment = student_assignment.assignment
+    if not Assignment.course.is_cached(assignment):
+        return None
+    course = assignment.course
+    if not Course.semester.is_cached(course):
+        return None
+    return course.semester.slug
+
+
 def assignment_submission_attachment_upload_to(self: "SubmissionAttachment",
                                                filename) -> str:
-    sa = self.submission.student_assignment
-    semester_slug = sa.assignment.course.semester.slug
-    return f'assignments/{semester_slug}/{sa.assignment_id}/user_{sa.student_id}/{filename}'
+    submission = self.submission
+    semester_slug = None
+    if AssignmentComment.student_assignment.is_cached(submission):
+        sa = submission.student_assignment
+        assignment_id, student_id = sa.assignment_id, sa.student_id
+        semester_slug = _get_cached_semester_slug(sa)
+    if semester_slug is None:
+        # Resolve the whole chain with one query instead of a query per relation
+        assignment_id, student_id, term_year, term_type = (
+            StudentAssignment.base
+            .filter(pk=submission.student_assignment_id)
+            .values_list('assignment_id', 'student_id',
+                         'assignment__course__semester__year',
+                         'assignment__course__semester__type')
+            .get())
+        semester_slug = Semester(year=term_year, type=term_type).slug
+    # Converted files are named after the full storage path of the source
+    # file, keep the base name only to not nest the upload directory twice
+    filename = filename.rpartition('/')[2]
+    return f'assignments/{semester_slug}/{assignment_id}/user_{student_id}/{filename}'
+
+
+_SID_PLACEHOLDER = '__sid__'
+_FILE_NAME_PLACEHOLDER = '__file_name__'
+
+
+@lru_cache(maxsize=1)
+def _get_submission_attachment_download_url_template() -> str:
+    return reverse("study:download_submission_attachment", kwargs={
+        "sid": _SID_PLACEHOLDER,
+        "file_name": _FILE_NAME_PLACEHOLDER
+    })
 
 
 class SubmissionAttachment(TimeStampedModel):
@@ -846,18 +1105,24 @@ class SubmissionAttachment(TimeStampedModel):
 
     @property
     def file_name(self):
-        return os.path.basename(self.attachment.name)
+        return self.attachment.name.rpartition('/')[2]
 
     @property
     def file_ext(self):
         _, ext = os.path.splitext(self.attachment.name)
         return ext
 
+    @cached_property
+    def encoded_sid(self) -> str:
+        return sqids.encode([self.pk])
+
     def get_download_url(self):
-        return reverse("study:download_submission_attachment", kwargs={
-            "sid": sqids.encode([self.pk]),
-            "file_name": self.file_name
-        })
+        # Skip URL resolver, the pattern is the same for all attachments.
+        # Quote the file name the same way as `reverse` does
+        file_name = quote(self.file_name, safe=RFC3986_SUBDELIMS + "/~:@")
+        return (_get_submission_attachment_download_url_template()
+                .replace(_SID_PLACEHOLDER, self.encoded_sid)
+                .replace(_FILE_NAME_PLACEHOLDER, file_name))
 
 
 class AssignmentNotification(TimezoneAwareMixin, TimeStampedModel):
@@ -902,7 +1167,7 @@ class AssignmentNotification(TimezoneAwareMixin, TimeStampedModel):
 
     def created_local(self, tz=None):
         if not tz:
-            tz = self.get_timezone()
+            tz = self._tz
         return timezone.localtime(self.created, timezone=tz)
 
 
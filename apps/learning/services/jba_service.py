@@ -5,6 +5,7 @@ from urllib.parse import urljoin, urlencode
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 from django_rq import get_queue
@@ -112,18 +113,27 @@ class JbaHttpClient(JbaClient):
 
 class JbaService:
     _client: JbaClient = JbaHttpClient()
-    _cached_course_info = {}
+    COURSE_INFO_CACHE_TIMEOUT = 3600
+    # Short-lived to not request the marketplace on each page view
+    UNKNOWN_LANGUAGE_CACHE_TIMEOUT = 300
 
     @staticmethod
     def get_course_info(jba_course_id: int) -> JbaCourseInfo:
-        if jba_course_id in JbaService._cached_course_info:
-            return JbaService._cached_course_info[jba_course_id]
+        cache_key = f'jba:course_info:{jba_course_id}'
+        cached = cache.get(cache_key)
+        if isinstance(cached, JbaCourseInfo):
+            return cached
+        elif cached is not None:
+            raise UnknownLanguage(cached)
         resp = requests.get(
-            f'https://plugins.jetbrains.com/api/plugins/{jba_course_id}'
+            f'https://plugins.jetbrains.com/api/plugins/{jba_course_id}',
+            timeout=10,
         )
         resp.raise_for_status()
         language_str = resp.json()['programmingLanguage']
         if not ProgrammingLanguage.contains(language_str):
+            cache.set(cache_key, language_str,
+                      JbaService.UNKNOWN_LANGUAGE_CACHE_TIMEOUT)
             raise UnknownLanguage(language_str)
         language = ProgrammingLanguage(language_str)
         supported_ides = IDE_BY_LANGUAGE[language]
@@ -139,7 +149,7 @@ class JbaService:
             id=jba_course_id,
             toolbox_link=toolbox_link,
         )
-        JbaService._cached_course_info[jba_course_id] = res
+        cache.set(cache_key, res, JbaService.COURSE_INFO_CACHE_TIMEOUT)
         return res
 
     @staticmethod
@@ -105,6 +105,8 @@ def update_personal_assignment_stats(*, personal_assignment: StudentAssignment)
     (StudentAssignment.objects
      .filter(pk=personal_assignment.pk)
      .update(meta=meta))
+    # Invalidate parsed stats since .meta could be modified in place
+    personal_assignment.__dict__.pop('stats', None)
 
 
 def create_assignment_solution(*, personal_assignment: StudentAssignment,
@@ -90,7 +90,7 @@ class StudentGroupService:
                 type=group_type,
                 name=name
             )
-            group.save()
+            group.save(validate=True)
             return group
         else:
             assert_never(group_type)
@@ -98,7 +98,7 @@ class StudentGroupService:
     @staticmethod
     def update(student_group: StudentGroup, *, name: str):
         student_group.name = name
-        student_group.save()
+        student_group.save(validate=True)
 
     @classmethod
     def remove(cls, student_group: StudentGroup):
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db.models import TextChoices, Case, When
@@ -65,6 +67,7 @@ class GradeTypes:
     values = {value: label for value, label in choices}
 
     @classmethod
+    @lru_cache(maxsize=32)
     def get_choices_for_grading_system(cls, grading_system: int):
         text_values = [GradeTypes.RE_CREDIT, GradeTypes.NOT_GRADED]
         num_values = []
@@ -83,9 +86,11 @@ class GradeTypes:
                 raise ValidationError(f'Invalid grading system {grading_system}')
         text_choices = [(x, cls._text_values[x]) for x in text_values]
         num_choices = [(x, str(x)) for x in num_values]
-        return text_choices + num_choices
+        # The result is cached, return an immutable sequence
+        return tuple(text_choices + num_choices)
 
     @classmethod
+    @lru_cache(maxsize=256)
     def get_display_grade(cls, grading_system, grade):
         if (
             grade in (GradeTypes.RE_CREDIT, GradeTypes.NOT_GRADED)
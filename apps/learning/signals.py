@@ -134,25 +134,22 @@ def create_deadline_change_notification(sender, instance: Assignment, created,
         or not instance.open_date_passed
     ):
         return
-    active_enrollments = Enrollment.active.filter(course=instance.course)
-    notification_ids = []
-    for e in active_enrollments:
-        try:
-            sa = (StudentAssignment.objects
-                  .only('pk')
-                  .get(student_id=e.student_id,
-                       assignment=instance))
-        except StudentAssignment.DoesNotExist:
-            # It can occur for student with inactive status
-            continue
-        obj = AssignmentNotification(
-            user_id=e.student_id,
-            student_assignment_id=sa.pk,
-            is_about_deadline=True
-        )
-        obj.save()
-        notification_ids.append(obj.id)
-    send_assignment_notifications.delay(notification_ids)
+    active_students = (Enrollment.active
+                       .filter(course_id=instance.course_id)
+                       .values('student_id'))
+    # Student assignment could be missing for student with inactive status
+    student_assignments = (StudentAssignment.objects
+                           .filter(assignment=instance,
+                                   student_id__in=active_students)
+                           .values_list('pk', 'student_id', named=True))
+    notifications = [
+        AssignmentNotification(user_id=sa.student_id,
+                               student_assignment_id=sa.pk,
+                               is_about_deadline=True)
+        for sa in student_assignments
+    ]
+    AssignmentNotification.objects.bulk_create(notifications, batch_size=500)
+    send_assignment_notifications.delay([x.id for x in notifications])
 
 
 @receiver(post_save, sender=Assignment)
@@ -192,6 +189,11 @@ def save_student_solution(sender, instance: AssignmentComment, *args, **kwargs):
     """Updates aggregated execution time value on StudentAssignment model"""
     if instance.type != AssignmentSubmissionTypes.SOLUTION:
         return
+    # Editing the solution text doesn't affect the aggregated value
+    if (not kwargs.get('created')
+            and not instance.has_field_changed('execution_time')
+            and not instance.has_field_changed('type')):
+        return
     instance.student_assignment.compute_fields('execution_time')
 
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable
 
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Div, Layout, Submit, Row
@@ -82,9 +82,11 @@ class StudentAssignmentListFilter(forms.Form):
         widget=forms.Select(attrs={"class": "form-control"})
     )
 
-    def __init__(self, enrolled_in: List[int], **kwargs):
+    def __init__(self, enrolled_in: Iterable[int], **kwargs):
         super().__init__(**kwargs)
         self.helper = FormHelper(self)
+        # Filtering does not change any data, submit it to the list view
+        self.helper.form_method = 'GET'
         self.helper.layout = Layout(
             Row(
                 Div('format', css_class='col-xs-3'),
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from django.db.models import QuerySet
+
 from core.urls import reverse
 from courses.constants import AssignmentFormat
 from courses.models import Semester
@@ -49,7 +51,16 @@ def save_solution_form(*, form: AssignmentSolutionBaseForm,
     return submission
 
 
-def get_current_semester_active_courses(student: User, current_term: Semester):
+def get_current_semester_active_courses(student: User,
+                                        current_term: Semester) -> QuerySet:
+    """
+    Returns ids of courses in the current term the student is enrolled in.
+
+    The result is a lazy queryset intended to be embedded as a subquery,
+    e.g. `course_id__in=...`, so reusing it within a request costs no
+    extra round-trips. Evaluate it explicitly only if ids are needed
+    in python.
+    """
     return (Enrollment.active
             .filter(course__semester=current_term, student=student)
             .values_list("course", flat=True))
@@ -5,6 +5,8 @@ import pytest
 from bs4 import BeautifulSoup
 from django.contrib.messages import get_messages
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.utils.encoding import smart_bytes
 
@@ -12,7 +14,7 @@ from auth.mixins import PermissionRequiredMixin
 from core.tests.factories import AcademicProgramRunFactory
 from core.urls import reverse
 from courses.constants import AssigneeMode, AssignmentFormat, AssignmentStatus
-from courses.models import CourseTeacher
+from courses.models import CourseProgramBinding, CourseTeacher
 from courses.tests.factories import (
     AssignmentFactory, CourseFactory, CourseTeacherFactory, SemesterFactory, CourseProgramBindingFactory
 )
@@ -21,6 +23,7 @@ from learning.models import (
     AssignmentComment, AssignmentNotification, StudentAssignment
 )
 from learning.permissions import ViewCourses, ViewOwnStudentAssignment
+from learning.services.enrollment_service import EnrollmentService
 from learning.services.jba_service import JbaService
 from learning.settings import StudentStatuses
 from learning.tests.factories import (
@@ -130,7 +133,7 @@ def test_view_student_assignment_detail_comment(client):
 
 
 @pytest.mark.django_db
-def test_view_new_comment_on_assignment_page(client, assert_redirect):
+def test_view_new_comment_on_assignment_page(client, assert_redirect, django_capture_on_commit_callbacks):
     semester = SemesterFactory.create_current()
     student_profile = StudentProfileFactory()
     course = CourseFactory(semester=semester)
@@ -158,7 +161,8 @@ def test_view_new_comment_on_assignment_page(client, assert_redirect):
         'comment-text': "Test comment with file",
         'comment-attached_file': SimpleUploadedFile("attachment1.txt", b"attachment1_content")
     }
-    response = client.post(create_comment_url, form_data)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(create_comment_url, form_data)
     assert_redirect(response, detail_url)
     response = client.get(detail_url)
     assert smart_bytes(form_data['comment-text']) in response.content
@@ -172,7 +176,8 @@ def test_view_new_comment_on_assignment_page(client, assert_redirect):
         'comment-attached_file': SimpleUploadedFile("a.txt", b"a_content"),
         'save-draft': 'Submit button text'
     }
-    response = client.post(create_comment_url, form_data)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(create_comment_url, form_data)
     assert_redirect(response, detail_url)
     assert AssignmentComment.objects.count() == 2
     assert AssignmentNotification.objects.count() == 0
@@ -195,7 +200,8 @@ def test_view_new_comment_on_assignment_page(client, assert_redirect):
         'comment-text': "Updated test comment 2 with file",
         'comment-attached_file': SimpleUploadedFile("test_file_b.txt", b"b_content"),
     }
-    response = client.post(create_comment_url, form_data)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(create_comment_url, form_data)
     assert_redirect(response, detail_url)
     assert AssignmentComment.published.count() == 2
     assert AssignmentNotification.objects.count() == recipients_count
@@ -516,6 +522,24 @@ def test_view_student_courses_list_enrollment_closed(
     assert set(cos_available) == set(response.context_data['ongoing_rest'])
 
 
+@pytest.mark.django_db
+def test_view_student_courses_list_teachers(client):
+    student = StudentFactory()
+    semester = SemesterFactory.create_current()
+    course = CourseFactory(semester=semester)
+    teacher = TeacherFactory(first_name='Ivan', last_name='Petrov')
+    CourseTeacherFactory(course=course, teacher=teacher)
+    EnrollmentFactory(course=course, student=student)
+    client.login(student)
+    response = client.get(reverse('study:course_list'))
+    assert response.status_code == 200
+    ongoing_enrolled = response.context_data['ongoing_enrolled']
+    assert ongoing_enrolled == [course]
+    course_teacher, = ongoing_enrolled[0].prefetched_teachers
+    assert course_teacher.teacher == teacher
+    assert teacher.get_abbreviated_name() in response.content.decode()
+
+
 @pytest.mark.django_db
 def test_view_student_courses_list_start_year_filter(client):
     url = reverse('study:course_list')
@@ -597,6 +621,25 @@ def test_view_student_courses_list_as_invited(client, program_cub001, program_ru
     assert len(response.context_data['archive']) == 1
 
 
+@pytest.mark.django_db
+def test_view_student_courses_list_invited_courses_subquery(client):
+    current_term = SemesterFactory.create_current()
+    course_invitation = CourseInvitationBindingFactory(course__semester=current_term)
+    invitation = course_invitation.invitation
+    other_course = CourseFactory(semester=current_term)
+    CourseInvitationBindingFactory(course=other_course, invitation=invitation)
+    student = UserFactory()
+    create_invited_profile(student, invitation)
+    client.login(student)
+    client.post(invitation.get_absolute_url())
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse('study:course_list'))
+    assert set(response.context_data['ongoing_rest']) == {course_invitation.course, other_course}
+    # Invited courses are resolved within the course query
+    binding_table = CourseProgramBinding._meta.db_table
+    assert not any(q['sql'].startswith(f'SELECT "{binding_table}"') for q in queries)
+
+
 @pytest.mark.django_db
 def test_view_student_courses_list_old_invited_profile(client):
     url = reverse('study:course_list')
@@ -641,6 +684,8 @@ def test_view_student_assignment_list_filter_course_choices(client):
     course_choices_pk = set(cc[0] for cc in filter_form.fields['course'].choices)
     assert len(course_choices_pk) == 3
     assert course_choices_pk == {None, course_one.pk, course_two.pk}
+    # Filters are submitted with GET, no redirect is needed
+    assert filter_form.helper.form_method == 'get'
 
 
 @pytest.mark.django_db
@@ -664,29 +709,29 @@ def test_view_student_assignment_list_course_filtering(client):
     form_data = {
         "course": course_one.pk
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert open_assignments == [sa_one]
-    assert f'course={course_one.pk}' in response.redirect_chain[-1][0]
+    assert f'course={course_one.pk}' in response.request['QUERY_STRING']
 
     form_data = {
         "course": course_two.pk
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert open_assignments == [sa_two]
-    assert f'course={course_two.pk}' in response.redirect_chain[-1][0]
+    assert f'course={course_two.pk}' in response.request['QUERY_STRING']
 
     form_data = {
         "course": ''
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa_one, sa_two}
-    assert 'course=' not in response.redirect_chain[-1][0]
+    assert response.context['filter_form'].cleaned_data['course'] is None
 
 
 @pytest.mark.django_db
@@ -745,26 +790,26 @@ def test_view_student_assignment_list_assignment_status_filtering(client):
     form_data = {
         "status": []
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c1, sa2_c1, sa3_c1, sa4_c1, sa_c2}
-    assert response.redirect_chain[-1][0][-1] == '?'  # /learning/assignments/?
+    assert 'status=' not in response.request['QUERY_STRING']
 
     form_data = {
         "status": [AssignmentStatus.NOT_SUBMITTED]
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c1, sa_c2}
-    assert f"status={AssignmentStatus.NOT_SUBMITTED}" in response.redirect_chain[-1][0]
+    assert f"status={AssignmentStatus.NOT_SUBMITTED}" in response.request['QUERY_STRING']
 
     # Status NEW not allowed, so filter is not working
     form_data = {
         "status": [AssignmentStatus.NEW]
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c1, sa2_c1, sa3_c1, sa4_c1, sa_c2}
@@ -774,13 +819,13 @@ def test_view_student_assignment_list_assignment_status_filtering(client):
                    AssignmentStatus.NEED_FIXES,
                    AssignmentStatus.COMPLETED]
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa2_c1, sa3_c1, sa4_c1}
-    assert f"status={AssignmentStatus.ON_CHECKING}" in response.redirect_chain[-1][0]
-    assert f"status={AssignmentStatus.NEED_FIXES}" in response.redirect_chain[-1][0]
-    assert f"status={AssignmentStatus.COMPLETED}" in response.redirect_chain[-1][0]
+    assert f"status={AssignmentStatus.ON_CHECKING}" in response.request['QUERY_STRING']
+    assert f"status={AssignmentStatus.NEED_FIXES}" in response.request['QUERY_STRING']
+    assert f"status={AssignmentStatus.COMPLETED}" in response.request['QUERY_STRING']
 
 
 @pytest.mark.django_db
@@ -808,31 +853,64 @@ def test_view_student_assignment_list_assignment_format_filtering(client):
     form_data = {
         "format": []
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c1, sa2_c1, sa3_c1, sa1_c2}
-    assert response.redirect_chain[-1][0][-1] == '?'  # /learning/assignments/?
+    assert 'format=' not in response.request['QUERY_STRING']
 
     form_data = {
         "format": [AssignmentFormat.NO_SUBMIT]
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c1, sa1_c2}
-    assert f"format={AssignmentFormat.NO_SUBMIT}" in response.redirect_chain[-1][0]
+    assert f"format={AssignmentFormat.NO_SUBMIT}" in response.request['QUERY_STRING']
 
     form_data = {
         "format": [AssignmentFormat.ONLINE,
                    AssignmentFormat.EXTERNAL]
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa2_c1, sa3_c1}
-    assert f"format={AssignmentFormat.ONLINE}" in response.redirect_chain[-1][0]
-    assert f"format={AssignmentFormat.EXTERNAL}" in response.redirect_chain[-1][0]
+    assert f"format={AssignmentFormat.ONLINE}" in response.request['QUERY_STRING']
+    assert f"format={AssignmentFormat.EXTERNAL}" in response.request['QUERY_STRING']
+
+
+@pytest.mark.django_db
+def test_view_student_assignment_list_num_queries(client, django_assert_max_num_queries):
+    course = CourseFactory(semester=SemesterFactory.create_current())
+    student = StudentFactory()
+    EnrollmentFactory(course=course, student=student)
+    AssignmentFactory(course=course)
+    url = reverse('study:assignment_list')
+    client.login(student)
+    client.get(url)
+    with CaptureQueriesContext(connection) as single_assignment:
+        client.get(url)
+    AssignmentFactory.create_batch(3, course=course)
+    with django_assert_max_num_queries(len(single_assignment)):
+        response = client.get(url)
+    assert len(response.context['assignment_list_open']) == 4
+
+
+@pytest.mark.django_db
+def test_view_student_assignment_list_left_course(client):
+    current_term = SemesterFactory.create_current()
+    course, left_course = CourseFactory.create_batch(2, semester=current_term)
+    student = StudentFactory()
+    EnrollmentFactory(course=course, student=student)
+    enrollment = EnrollmentFactory(course=left_course, student=student)
+    AssignmentFactory(course=course)
+    AssignmentFactory(course=left_course)
+    EnrollmentService.leave(enrollment)
+    client.login(student)
+    response = client.get(reverse('study:assignment_list'))
+    assignments = response.context['assignment_list_open'] + response.context['assignment_list_archive']
+    assert [sa.assignment.course_id for sa in assignments] == [course.pk]
 
 
 @pytest.mark.django_db
@@ -880,44 +958,44 @@ def test_view_student_assignment_list_filtering(client):
         "status": [],
         "format": []
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c1, sa2_c1, sa3_c1, sa1_c2, sa3_c2}
-    assert response.redirect_chain[-1][0][-1] == '?'  # /learning/assignments/?
+    assert response.request['QUERY_STRING'] == 'course='
 
     form_data = {
         "course": course_two.pk,
         "format": [AssignmentFormat.NO_SUBMIT, AssignmentFormat.EXTERNAL],
         "status": [AssignmentStatus.COMPLETED]
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert not set(open_assignments)
-    assert f"course={course_two.pk}" in response.redirect_chain[-1][0]
-    assert f"format={AssignmentFormat.NO_SUBMIT}" in response.redirect_chain[-1][0]
-    assert f"format={AssignmentFormat.EXTERNAL}" in response.redirect_chain[-1][0]
-    assert f"status={AssignmentStatus.COMPLETED}" in response.redirect_chain[-1][0]
+    assert f"course={course_two.pk}" in response.request['QUERY_STRING']
+    assert f"format={AssignmentFormat.NO_SUBMIT}" in response.request['QUERY_STRING']
+    assert f"format={AssignmentFormat.EXTERNAL}" in response.request['QUERY_STRING']
+    assert f"status={AssignmentStatus.COMPLETED}" in response.request['QUERY_STRING']
 
     form_data["status"] = [AssignmentStatus.NOT_SUBMITTED]
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c2, sa3_c2}
-    assert f"status={AssignmentStatus.NOT_SUBMITTED}" in response.redirect_chain[-1][0]
+    assert f"status={AssignmentStatus.NOT_SUBMITTED}" in response.request['QUERY_STRING']
 
     form_data = {
         "course": '',
         "format": [AssignmentFormat.NO_SUBMIT],
         "status": [AssignmentStatus.NOT_SUBMITTED]
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c1, sa1_c2}
-    assert f"format={AssignmentFormat.NO_SUBMIT}" in response.redirect_chain[-1][0]
-    assert f"status={AssignmentStatus.NOT_SUBMITTED}" in response.redirect_chain[-1][0]
+    assert f"format={AssignmentFormat.NO_SUBMIT}" in response.request['QUERY_STRING']
+    assert f"status={AssignmentStatus.NOT_SUBMITTED}" in response.request['QUERY_STRING']
 
     form_data = {
         "course": '',
@@ -925,22 +1003,22 @@ def test_view_student_assignment_list_filtering(client):
         "status": [AssignmentStatus.NOT_SUBMITTED, AssignmentStatus.ON_CHECKING,
                    AssignmentStatus.NEED_FIXES, AssignmentStatus.COMPLETED]
     }
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa2_c1, sa3_c1, sa3_c2}
 
-    assert f"format={AssignmentFormat.ONLINE}" in response.redirect_chain[-1][0]
-    assert f"format={AssignmentFormat.EXTERNAL}" in response.redirect_chain[-1][0]
+    assert f"format={AssignmentFormat.ONLINE}" in response.request['QUERY_STRING']
+    assert f"format={AssignmentFormat.EXTERNAL}" in response.request['QUERY_STRING']
 
-    assert f"status={AssignmentStatus.NOT_SUBMITTED}" in response.redirect_chain[-1][0]
-    assert f"status={AssignmentStatus.ON_CHECKING}" in response.redirect_chain[-1][0]
-    assert f"status={AssignmentStatus.NEED_FIXES}" in response.redirect_chain[-1][0]
-    assert f"status={AssignmentStatus.COMPLETED}" in response.redirect_chain[-1][0]
+    assert f"status={AssignmentStatus.NOT_SUBMITTED}" in response.request['QUERY_STRING']
+    assert f"status={AssignmentStatus.ON_CHECKING}" in response.request['QUERY_STRING']
+    assert f"status={AssignmentStatus.NEED_FIXES}" in response.request['QUERY_STRING']
+    assert f"status={AssignmentStatus.COMPLETED}" in response.request['QUERY_STRING']
 
     # forbidden status AssignmentStatus.NEW for filter
     form_data["status"].append(AssignmentStatus.NEW)
-    response = client.post(url, form_data, follow=True)
+    response = client.get(url, form_data)
     assert response.status_code == 200
     open_assignments = response.context['assignment_list_open']
     assert set(open_assignments) == {sa1_c1, sa2_c1, sa3_c1, sa1_c2, sa3_c2}
@@ -1,6 +1,5 @@
 from datetime import date
 from typing import Iterable, List
-from urllib import parse
 
 from django.shortcuts import redirect
 from isoweek import Week
@@ -8,7 +7,8 @@ from vanilla import GenericModelView, TemplateView
 
 from django.contrib import messages
 from django.db import transaction
-from django.db.models import Prefetch, Q
+from django.db.models import BooleanField, Case, CharField, Prefetch, Q, Value, When
+from django.db.models.functions import Now
 from django.http import HttpResponseBadRequest, HttpResponseRedirect
 from django.utils.translation import gettext_lazy as _
 from django.views import generic
@@ -71,7 +71,9 @@ class CalendarFullView(PermissionRequiredMixin, MonthEventsCalendarView):
         start_date, end_date = extended_month_date_range(month_period, expand=1)
         user = self.request.user
         student_profile = get_student_profile(user)
-        programs = [student_profile.academic_program_enrollment.program]
+        if not student_profile or not student_profile.academic_program_enrollment:
+            return []
+        programs = [student_profile.academic_program_enrollment.program_id]
         return get_all_calendar_events(
             program_list=programs,
             start_date=start_date,
@@ -105,12 +107,13 @@ class TimetableView(PermissionRequiredMixin, WeekEventsView):
     template_name = "lms/learning/timetable.html"
     permission_required = "study.view_schedule"
 
-    def get_events(self, iso_year, iso_week) -> Iterable[CalendarEvent]:
+    def get_events(self, iso_year, iso_week) -> List[CalendarEvent]:
         w = Week(iso_year, iso_week)
         in_range = [Q(date__range=[w.monday(), w.sunday()])]
         user = self.request.user
-        for c in get_student_classes(user, in_range, with_venue=True):
-            yield TimetableEvent.create(c, time_zone=user.time_zone)
+        time_zone = user.time_zone
+        classes = get_student_classes(user, in_range, with_venue=True)
+        return [TimetableEvent.create(c, time_zone=time_zone) for c in classes]
 
 
 class StudentAssignmentListView(PermissionRequiredMixin, TemplateView):
@@ -119,13 +122,14 @@ class StudentAssignmentListView(PermissionRequiredMixin, TemplateView):
     template_name = "lms/study/assignment_list.html"
     permission_required = ViewOwnStudentAssignments.name
 
-    def get_queryset(self, current_term):
+    def get_queryset(self, current_term, filter_course=None, filter_formats=None,
+                     filter_statuses=None):
         today = get_now_utc().date()
-        left_enrollments = Enrollment.objects.filter(
+        # Evaluated as a subquery
+        left_courses = Enrollment.objects.filter(
             student=self.request.user, is_deleted=True, course__completed_at__gt=today
-        )
-        left_courses = [e.course_id for e in left_enrollments]
-        return (
+        ).values("course_id")
+        queryset = (
             StudentAssignment.objects.for_student(self.request.user)
             .filter(assignment__course__completed_at__gt=today)
             .exclude(assignment__course__pk__in=left_courses)
@@ -133,11 +137,18 @@ class StudentAssignmentListView(PermissionRequiredMixin, TemplateView):
                 "assignment__deadline_at", "assignment__course__meta_course__name", "pk"
             )
         )
+        if filter_course is not None:
+            queryset = queryset.filter(assignment__course_id=filter_course)
+        if filter_formats:
+            queryset = queryset.filter(assignment__submission_type__in=filter_formats)
+        if filter_statuses:
+            queryset = queryset.filter(status__in=filter_statuses)
+        return queryset
 
     def get_context_data(
         self,
         filter_form: StudentAssignmentListFilter,
-        enrolled_in_courses: List[int],
+        enrolled_in_courses: Iterable[int],
         current_term: Semester,
         **kwargs,
     ):
@@ -145,18 +156,26 @@ class StudentAssignmentListView(PermissionRequiredMixin, TemplateView):
         filter_course = kwargs.get("course", None)
         filter_formats = kwargs.get("formats", [])
         filter_statuses = kwargs.get("statuses", [])
-        assignment_list = filter(
-            lambda sa: (
-                filter_course is None or sa.assignment.course_id == filter_course
+        assignment_list = self.get_queryset(
+            current_term,
+            filter_course=filter_course,
+            filter_formats=filter_formats,
+            filter_statuses=filter_statuses,
+        )
+        assignment_list = assignment_list.annotate(
+            is_open=Case(
+                When(
+                    assignment__deadline_at__gte=Now(),
+                    assignment__course_id__in=enrolled_in_courses,
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
             )
-            and (not filter_formats or sa.assignment.submission_type in filter_formats)
-            and (not filter_statuses or sa.status in filter_statuses),
-            self.get_queryset(current_term),
         )
+        # Rows are streamed into two lists without filling the queryset cache
         in_progress, archive = utils.split_on_condition(
-            assignment_list,
-            lambda sa: not sa.assignment.deadline_is_exceeded
-            and sa.assignment.course_id in enrolled_in_courses,
+            assignment_list.iterator(chunk_size=200), lambda sa: sa.is_open
         )
         archive.reverse()
         context = {
@@ -196,41 +215,6 @@ class StudentAssignmentListView(PermissionRequiredMixin, TemplateView):
         )
         return self.render_to_response(context)
 
-    def post(self, request, *args, **kwargs):
-        current_term = Semester.get_current()
-        enrolled_in = get_current_semester_active_courses(
-            request.user, Semester.get_current()
-        )
-        filter_form = StudentAssignmentListFilter(enrolled_in, data=request.POST)
-        filter_course = None
-        if filter_form.is_valid():
-            filter_course = filter_form.cleaned_data["course"]
-            filter_formats = filter_form.cleaned_data["format"]
-            filter_statuses = filter_form.cleaned_data["status"]
-            url = reverse("study:assignment_list")
-            # Build params list to ensure format is always included
-            params_list = []
-            if filter_course is not None:
-                params_list.append(("course", filter_course))
-            # Always include format parameter, even if empty list
-            if filter_formats:
-                for fmt in filter_formats:
-                    params_list.append(("format", fmt))
-            if filter_statuses:
-                for status in filter_statuses:
-                    params_list.append(("status", status))
-            params = parse.urlencode(params_list)
-            request.session["STUDENT_ASSIGNMENT_FILTERS"] = params
-            return redirect(f"{url}?{params}" if params else url)
-        context = self.get_context_data(
-            filter_form=filter_form,
-            enrolled_in_courses=enrolled_in,
-            current_term=current_term,
-            course=filter_course,
-            **kwargs,
-        )
-        return self.render_to_response(context)
-
 
 class StudentAssignmentDetailView(
     PermissionRequiredMixin, AssignmentSubmissionBaseView
@@ -352,48 +336,58 @@ class CourseListView(PermissionRequiredMixin, generic.TemplateView):
         # courses in this term available via invitation
         # and all courses that student enrolled in
         student_profile = get_student_profile(auth_user)
-        qs = Course.objects.filter(id__in=list(student_enrollments))
-        courses_pk = [
-            ci.course_id
-            for ci in (
-                CourseProgramBinding.objects.student_can_enroll_by_invitation(
-                    student_profile
-                ).only("course_id")
-            )
-        ]
-        qs |= Course.objects.filter(id__in=courses_pk)
+        invited_courses = CourseProgramBinding.objects.student_can_enroll_by_invitation(
+            student_profile
+        ).values("course_id")
+        q = Q(id__in=list(student_enrollments)) | Q(id__in=invited_courses)
         if (
             student_profile.type != StudentTypes.INVITED
             and student_profile.academic_program_enrollment
         ):
-            qs |= Course.objects.student_can_enroll_from_program(student_profile)
+            program_courses = Course.objects.student_can_enroll_from_program(
+                student_profile
+            )
+            q |= Q(id__in=program_courses.values("pk"))
         if student_profile.type == StudentTypes.ALUMNI:
-            qs |= Course.objects.alumni_can_enroll()
+            q |= Q(id__in=Course.objects.alumni_can_enroll().values("pk"))
+        # Only the abbreviated teacher name is rendered on this page
+        teachers = course_teachers_prefetch_queryset().only(
+            "id", "course_id", "teacher_id", "roles",
+            "teacher__first_name", "teacher__last_name", "teacher__username",
+        )
         prefetch_teachers = Prefetch(
-            "course_teachers", queryset=course_teachers_prefetch_queryset()
+            "course_teachers", queryset=teachers, to_attr="prefetched_teachers"
+        )
+        # Group collected courses on the database side, rows of completed
+        # courses the student is not enrolled in are not fetched at all
+        today = date.today()
+        enrolled = list(student_enrollments)
+        category = Case(
+            When(
+                completed_at__gt=today, pk__in=enrolled, then=Value("ongoing_enrolled")
+            ),
+            When(completed_at__gt=today, then=Value("ongoing_rest")),
+            When(pk__in=enrolled, then=Value("archive")),
+            default=None,
+            output_field=CharField(),
         )
         courses = (
-            qs.select_related("meta_course", "semester")
-            .distinct()
+            Course.objects.filter(q)
+            .annotate(category=category)
+            .filter(category__isnull=False)
+            .select_related("meta_course", "semester")
             .order_by("-semester__index", "meta_course__name", "pk")
             .prefetch_related(prefetch_teachers)
         )
-        # Group collected courses
-        ongoing_enrolled, ongoing_rest, archive = [], [], []
-        current_term = get_current_term_pair(auth_user.time_zone)
+        grouped = {"ongoing_enrolled": [], "ongoing_rest": [], "archive": []}
         for course in courses:
-            if course.completed_at > date.today():
-                if course.pk in student_enrollments:
-                    ongoing_enrolled.append(course)
-                else:
-                    ongoing_rest.append(course)
-            elif course.pk in student_enrollments:
-                archive.append(course)
+            grouped[course.category].append(course)
+        current_term = get_current_term_pair(auth_user.time_zone)
         context = {
             "enrollments": student_enrollments,
-            "ongoing_rest": ongoing_rest,
-            "ongoing_enrolled": ongoing_enrolled,
-            "archive": archive,
+            "ongoing_rest": grouped["ongoing_rest"],
+            "ongoing_enrolled": grouped["ongoing_enrolled"],
+            "archive": grouped["archive"],
             "current_term": current_term.label.capitalize(),
             "EnrollOrLeavePermissionObject": EnrollOrLeavePermissionObject,
         }
@@ -3,8 +3,9 @@ from django_rq import job
 
 from files.utils import convert_ipynb_to_html
 from learning.models import AssignmentComment, StudentAssignment, SubmissionAttachment, AssignmentNotification
+from learning.services.notification_service import generate_notifications_about_new_submission
 from learning.services.personal_assignment_service import (
-    update_personal_assignment_stats
+    maybe_set_assignee_for_personal_assignment, update_personal_assignment_stats
 )
 
 logger = logging.getLogger(__file__)
@@ -13,7 +14,9 @@ logger = logging.getLogger(__file__)
 @job('default')
 def convert_assignment_submission_ipynb_file_to_html(*, assignment_submission_id):
     try:
-        submission = AssignmentComment.objects.get(pk=assignment_submission_id)
+        submission = (AssignmentComment.objects
+                      .with_upload_context()
+                      .get(pk=assignment_submission_id))
     except AssignmentComment.DoesNotExist:
         logger.debug(f"Submission with id={assignment_submission_id} not found")
         return
@@ -32,6 +35,18 @@ def convert_assignment_submission_ipynb_file_to_html(*, assignment_submission_id
     submission_attachment.save()
 
 
+@job('default')
+def handle_published_assignment_submission(*, submission_id: int) -> None:
+    submission = (AssignmentComment.objects
+                  .select_related('student_assignment__assignment__course')
+                  .filter(pk=submission_id)
+                  .first())
+    if not submission:
+        return
+    maybe_set_assignee_for_personal_assignment(submission.pk)
+    generate_notifications_about_new_submission(submission)
+
+
 @job('default')
 def update_student_assignment_stats(student_assignment_id: int) -> None:
     student_assignment = (StudentAssignment.objects
@@ -284,7 +284,7 @@ def test_student_assignment_detail_view_add_comment(client):
 
 
 @pytest.mark.django_db
-def test_view_student_assignment_detail_draft_comment_notifications(client, assert_redirect):
+def test_view_student_assignment_detail_draft_comment_notifications(client, assert_redirect, django_capture_on_commit_callbacks):
     """
     Draft comment shouldn't send any notification until publishing.
     New published comment should replace draft comment record.
@@ -319,7 +319,8 @@ def test_view_student_assignment_detail_draft_comment_notifications(client, asse
         'review-attached_file': SimpleUploadedFile("attachment1.txt",
                                                    b"attachment1_content")
     }
-    response = client.post(teacher_detail_url, form_data)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(teacher_detail_url, form_data)
     assert_redirect(response, teacher_detail_url)
     response = client.get(teacher_detail_url)
     assert smart_bytes(form_data['review-text']) in response.content
@@ -337,7 +338,8 @@ def test_view_student_assignment_detail_draft_comment_notifications(client, asse
         'review-attached_file': SimpleUploadedFile("a.txt", b"a_content"),
         'save-draft': 'Submit button text'
     }
-    response = client.post(teacher_detail_url, form_data)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(teacher_detail_url, form_data)
     assert_redirect(response, teacher_detail_url)
     assert AssignmentComment.objects.count() == 2
     assert AssignmentNotification.objects.count() == 0
@@ -363,7 +365,8 @@ def test_view_student_assignment_detail_draft_comment_notifications(client, asse
         'review-text': "Updated test comment 2 with file",
         'review-attached_file': SimpleUploadedFile("test_file_b.txt", b"b_content"),
     }
-    response = client.post(teacher_detail_url, form_data)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(teacher_detail_url, form_data)
     assert_redirect(response, teacher_detail_url)
     assert AssignmentComment.published.count() == 2
     assert AssignmentNotification.objects.count() == recipients_count
@@ -2,12 +2,13 @@ import os.path
 from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 
 from courses.constants import AssignmentFormat
 from courses.tests.factories import AssignmentFactory
 from learning.models import StudentAssignment, AssignmentComment
-from learning.services.jba_service import JbaService, JbaClient, JbaCourse
+from learning.services.jba_service import JbaService, JbaClient, JbaCourse, UnknownLanguage
 from learning.tests.factories import EnrollmentFactory
 
 KOTLIN_KOANS_ID = 16628
@@ -123,3 +124,22 @@ def test_update_assignment_progress(mock_jba_service):
         comment_count=1, solved_task_ids=[HELLO_WORLD_TASK_ID, NAMED_ARGUMENTS_TASK_ID]
     )
     assert last_comment.created == assignment.deadline_at
+
+
+def test_get_course_info_cached(mocker):
+    cache.clear()
+    mocked_get = mocker.patch('learning.services.jba_service.requests.get')
+    mocked_get.return_value.json.return_value = {'programmingLanguage': 'kotlin'}
+    course_info = JbaService.get_course_info(KOTLIN_KOANS_ID)
+    assert course_info.id == KOTLIN_KOANS_ID
+    assert JbaService.get_course_info(KOTLIN_KOANS_ID) == course_info
+    assert mocked_get.call_count == 1
+    # Unknown language is cached too
+    cache.clear()
+    mocked_get.return_value.json.return_value = {'programmingLanguage': 'Cobol'}
+    for _ in range(2):
+        with pytest.raises(UnknownLanguage) as e:
+            JbaService.get_course_info(KOTLIN_KOANS_ID)
+        assert e.value.language == 'Cobol'
+    assert mocked_get.call_count == 2
+    cache.clear()
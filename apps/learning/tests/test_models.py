@@ -9,17 +9,21 @@ from django.db.models import ProtectedError
 from django.utils.encoding import smart_str
 
 from core.tests.factories import LocationFactory
+from core.urls import reverse
+from core.utils import sqids
 from courses.constants import AssignmentFormat, AssignmentStatus
 from courses.models import CourseGroupModes, CourseNews, Semester, StudentGroupTypes, CourseProgramBinding
 from courses.tests.factories import (
     AssignmentFactory, CourseClassAttachmentFactory, CourseClassFactory, CourseFactory,
     CourseNewsFactory, CourseTeacherFactory, LearningSpaceFactory, MetaCourseFactory,
-    CourseProgramBindingFactory
+    CourseProgramBindingFactory, SemesterFactory
 )
 from learning.models import (
     AssignmentComment, AssignmentNotification, AssignmentSubmissionTypes,
-    StudentAssignment, StudentGroup, Enrollment
+    Invitation, StudentAssignment, StudentGroup, Enrollment, EnrollmentGradeLog,
+    SubmissionAttachment, assignment_submission_attachment_upload_to
 )
+from learning.settings import EnrollmentGradeUpdateSource, GradeTypes, GradingSystems
 from learning.tests.factories import (
     AssignmentCommentFactory, AssignmentNotificationFactory,
     CourseNewsNotificationFactory, EnrollmentFactory,
@@ -144,6 +148,46 @@ def test_assignment_comment_attached_file():
     assert re.compile(r"^foobar(_[0-9a-zA-Z]+)?.pdf$").search(assignment_comment.attached_file_name)
 
 
+@pytest.mark.django_db
+def test_assignment_submission_attachment_upload_to(django_assert_num_queries):
+    comment = AssignmentCommentFactory()
+    sa = comment.student_assignment
+    semester_slug = sa.assignment.course.semester.slug
+    expected = f'assignments/{semester_slug}/{sa.assignment_id}/user_{sa.student_id}/a.html'
+    submission = AssignmentComment.objects.get(pk=comment.pk)
+    with django_assert_num_queries(1):
+        attachment = SubmissionAttachment(submission=submission)
+        assert assignment_submission_attachment_upload_to(attachment, 'a.html') == expected
+    submission = AssignmentComment.objects.with_upload_context().get(pk=comment.pk)
+    with django_assert_num_queries(0):
+        attachment = SubmissionAttachment(submission=submission)
+        assert assignment_submission_attachment_upload_to(attachment, 'a.html') == expected
+    # Converted file is named after the source file path
+    source_path = expected.replace('a.html', 'a.ipynb')
+    upload_path = assignment_submission_attachment_upload_to(attachment, f'{source_path}.html')
+    assert upload_path == f'{source_path}.html'
+
+
+@pytest.mark.django_db
+def test_submission_attachment_get_download_url():
+    comment = AssignmentCommentFactory()
+    attachment = SubmissionAttachment(pk=42, submission=comment)
+    attachment.attachment.name = 'assignments/2024-autumn/1/user_1/решение #1 (v2).ipynb.html'
+    assert attachment.get_download_url() == reverse("study:download_submission_attachment", kwargs={
+        "sid": sqids.encode([42]),
+        "file_name": 'решение #1 (v2).ipynb.html'
+    })
+
+
+def test_submission_attachment_encoded_sid(mocker):
+    attachment = SubmissionAttachment(pk=42)
+    spy = mocker.spy(sqids, 'encode')
+    assert attachment.encoded_sid == sqids.encode([42])
+    assert attachment.encoded_sid == sqids.encode([42])
+    # Encoded once for the instance, once for each expected value
+    assert spy.call_count == 3
+
+
 @pytest.mark.django_db
 def test_assignment_notification_validate():
     an = AssignmentNotificationFactory.create(
@@ -180,10 +224,11 @@ def test_score_field():
 
 
 @pytest.mark.django_db
-def test_soft_delete_student_assignment():
+def test_soft_delete_student_assignment(django_capture_on_commit_callbacks):
     assignment = AssignmentFactory()
     sa = StudentAssignmentFactory(assignment=assignment)
-    comment = AssignmentCommentFactory(student_assignment=sa)
+    with django_capture_on_commit_callbacks(execute=True):
+        comment = AssignmentCommentFactory(student_assignment=sa)
     assert AssignmentNotification.objects.count() == 1
     assert AssignmentComment.objects.count() == 1
     sa.delete()
@@ -221,6 +266,28 @@ def test_learning_space_full_name():
     assert learning_space.full_name == 'Hello, Zombie'
 
 
+@pytest.mark.django_db
+def test_student_assignment_loaded_score_value():
+    student_assignment = StudentAssignmentFactory(assignment__maximum_score=10)
+    assert student_assignment.get_loaded_value('score') is None
+    assert not student_assignment.has_field_changed('score')
+    student_assignment.score = 5
+    assert student_assignment.has_field_changed('score')
+    student_assignment.save()
+    assert student_assignment.get_loaded_value('score') == 5
+    assert not student_assignment.has_field_changed('score')
+    student_assignment = StudentAssignment.objects.get(pk=student_assignment.pk)
+    assert student_assignment.get_loaded_value('score') == 5
+    student_assignment.score = 7
+    assert student_assignment.has_field_changed('score')
+    assert student_assignment.get_loaded_value('score') == 5
+    student_assignment.refresh_from_db()
+    assert not student_assignment.has_field_changed('score')
+    # Deferred field is considered as unchanged
+    student_assignment = StudentAssignment.objects.only('pk').get(pk=student_assignment.pk)
+    assert not student_assignment.has_field_changed('score')
+
+
 @pytest.mark.django_db
 def test_student_assignment_execution_time():
     student_assignment = StudentAssignmentFactory()
@@ -239,6 +306,72 @@ def test_student_assignment_execution_time():
     # Recalculate on removing solution through admin interface
     solution2.delete()
     assert student_assignment.execution_time == timedelta(hours=2)
+    solution1 = AssignmentComment.objects.get(pk=solution1.pk)
+    solution1.execution_time = timedelta(hours=1)
+    solution1.save()
+    student_assignment.refresh_from_db()
+    assert student_assignment.execution_time == timedelta(hours=1)
+
+
+@pytest.mark.django_db
+def test_student_assignment_execution_time_solution_text_changed(mocker):
+    solution = AssignmentCommentFactory(type=AssignmentSubmissionTypes.SOLUTION,
+                                        execution_time=timedelta(hours=2))
+    solution = AssignmentComment.objects.get(pk=solution.pk)
+    mocked = mocker.patch.object(StudentAssignment, 'compute_fields')
+    solution.text = 'Updated solution'
+    solution.save()
+    assert not mocked.called
+
+
+
+@pytest.mark.django_db
+def test_assignment_comment_local_datetimes(mocker):
+    comment = AssignmentCommentFactory()
+    course = comment.student_assignment.assignment.course
+    comment = AssignmentComment.objects.get(pk=comment.pk)
+    spy = mocker.spy(comment, 'get_timezone')
+    created_local = comment.created_local()
+    modified_local = comment.modified_local()
+    # Time zone is cached on the instance
+    assert spy.call_count == 1
+    assert created_local.tzinfo == course.time_zone
+    assert modified_local.tzinfo == course.time_zone
+
+
+def test_assignment_comment_get_execution_time_display():
+    comment = AssignmentCommentFactory.build(execution_time=None)
+    assert comment.get_execution_time_display() == "-:-"
+    comment.execution_time = timedelta(hours=2, minutes=3, seconds=59)
+    assert comment.get_execution_time_display() == "2:03"
+    comment.execution_time = timedelta(days=1, minutes=5)
+    assert comment.get_execution_time_display() == "1 д. 0:05"
+
+
+@pytest.mark.django_db
+def test_student_assignment_recompute_execution_time_bulk(django_assert_num_queries):
+    assignment = AssignmentFactory()
+    sa1, sa2, sa3 = StudentAssignmentFactory.create_batch(3, assignment=assignment)
+    AssignmentCommentFactory(student_assignment=sa1,
+                             type=AssignmentSubmissionTypes.SOLUTION,
+                             execution_time=timedelta(hours=1))
+    AssignmentCommentFactory(student_assignment=sa1,
+                             type=AssignmentSubmissionTypes.SOLUTION,
+                             execution_time=timedelta(minutes=5))
+    AssignmentCommentFactory(student_assignment=sa2,
+                             type=AssignmentSubmissionTypes.SOLUTION,
+                             execution_time=timedelta(minutes=30))
+    # Make stored values inconsistent
+    StudentAssignment.objects.filter(assignment=assignment).update(execution_time=None)
+    queryset = StudentAssignment.objects.filter(assignment=assignment)
+    with django_assert_num_queries(3):
+        assert StudentAssignment.recompute_execution_time_bulk(queryset) == 2
+    sa1.refresh_from_db()
+    sa2.refresh_from_db()
+    sa3.refresh_from_db()
+    assert sa1.execution_time == timedelta(hours=1, minutes=5)
+    assert sa2.execution_time == timedelta(minutes=30)
+    assert sa3.execution_time is None
 
 
 @pytest.mark.django_db
@@ -345,3 +478,84 @@ def test_course_delete_with_existing_enrollments():
         course.delete()
     with pytest.raises(ProtectedError):
         binding.delete()
+
+
+@pytest.mark.django_db
+def test_enrollment_grade_properties_with_grading_system(django_assert_num_queries):
+    course = CourseFactory()
+    binding = CourseProgramBindingFactory(course=course,
+                                          grading_system_num=GradingSystems.BINARY)
+    EnrollmentFactory(course=course, course_program_binding=binding,
+                      grade=GradeTypes.PASS)
+    with django_assert_num_queries(1):
+        enrollment = Enrollment.active.with_grading_system().get(course=course)
+        assert enrollment.grade_display == "Pass"
+        assert enrollment.grade_css_class == "good __binary"
+        assert dict(enrollment.grade_choices)[GradeTypes.FAIL] == "Fail"
+
+
+@pytest.mark.django_db
+def test_enrollment_bulk_update_grades():
+    teacher = TeacherFactory()
+    course = CourseFactory()
+    e1, e2, e3 = EnrollmentFactory.create_batch(3, course=course)
+    source = EnrollmentGradeUpdateSource.GRADEBOOK
+    updated = Enrollment.bulk_update_grades([
+        (e1.pk, GradeTypes.GOOD, teacher.pk, source),
+        (e2.pk, GradeTypes.FAIL, teacher.pk, source),
+    ])
+    assert updated == 2
+    e1.refresh_from_db()
+    e2.refresh_from_db()
+    e3.refresh_from_db()
+    assert e1.grade == GradeTypes.GOOD
+    assert e2.grade == GradeTypes.FAIL
+    assert e3.grade == GradeTypes.NOT_GRADED
+    assert e1.grade_changed == e2.grade_changed
+    assert EnrollmentGradeLog.objects.count() == 2
+    log_entry = EnrollmentGradeLog.objects.get(enrollment=e1)
+    assert log_entry.grade == GradeTypes.GOOD
+    assert log_entry.entry_author == teacher
+    assert log_entry.source == source
+    assert Enrollment.bulk_update_grades([]) == 0
+
+
+@pytest.mark.django_db
+def test_enrollment_clean_bulk(django_assert_num_queries):
+    course = CourseFactory()
+    EnrollmentFactory.create_batch(3, course=course)
+    enrollments = list(Enrollment.objects.filter(course=course))
+    # binding, student group, student profile with academic program
+    # enrollment and invitations
+    with django_assert_num_queries(5):
+        Enrollment.clean_bulk(enrollments)
+    enrollments = list(Enrollment.objects.filter(course=course))
+    enrollments[0].student_group = StudentGroupFactory()
+    with pytest.raises(ValidationError) as e:
+        Enrollment.clean_bulk(enrollments)
+    assert len(e.value.messages) == 1
+
+
+@pytest.mark.django_db
+def test_invitation_bulk_create_with_tokens(django_assert_num_queries):
+    semester = SemesterFactory()
+    invitations = [Invitation(name=f"Invitation {i}", semester=semester) for i in range(3)]
+    invitations.append(Invitation(name="With token", semester=semester, token="token"))
+    with django_assert_num_queries(1):
+        Invitation.bulk_create_with_tokens(invitations)
+    tokens = set(Invitation.objects.values_list('token', flat=True))
+    assert len(tokens) == 4
+    assert "token" in tokens
+    assert all(len(t) == 64 for t in tokens - {"token"})
+
+
+@pytest.mark.django_db
+def test_student_group_bulk_create_with_enrollment_keys():
+    course = CourseFactory(group_mode=CourseGroupModes.MANUAL)
+    student_groups = [StudentGroup(course=course, type=StudentGroupTypes.MANUAL, name=f"Group {i}")
+                      for i in range(3)]
+    StudentGroup.bulk_create_with_enrollment_keys(student_groups)
+    keys = set(StudentGroup.objects.filter(type=StudentGroupTypes.MANUAL)
+               .values_list('enrollment_key', flat=True))
+    assert len(keys) == 3
+    assert all(len(k) == 24 for k in keys)
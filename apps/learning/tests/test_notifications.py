@@ -34,7 +34,7 @@ def _get_unread(client, url):
 
 
 @pytest.mark.django_db
-def test_view_new_assignment(client):
+def test_view_new_assignment(client, django_capture_on_commit_callbacks):
     teacher1 = TeacherFactory()
     teacher2 = TeacherFactory()
     course = CourseFactory(teachers=[teacher1, teacher2])
@@ -92,7 +92,8 @@ def test_view_new_assignment(client):
     assert not is_course_failed_by_student(course, student)
     client.login(student)
     mail.outbox = []
-    client.post(student_create_comment_url, student_comment_dict)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(student_create_comment_url, student_comment_dict)
     assert 2 == (AssignmentNotification.objects
                  .filter(is_about_passed=False,
                          is_unread=True,
@@ -112,7 +113,8 @@ def test_view_new_assignment(client):
     assert len(_get_unread(client, teacher_list_url).assignments) == 0
     # Teacher left a comment
     mail.outbox = []
-    client.post(teacher_create_comment_url, teacher_comment_dict)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(teacher_create_comment_url, teacher_comment_dict)
     unread_msgs_for_student = (AssignmentNotification.objects
                                .filter(user=student,
                                        is_unread=True,
@@ -124,7 +126,8 @@ def test_view_new_assignment(client):
     assert len(_get_unread(client, student_list_url).assignments) == 1
     # Student left a comment again
     mail.outbox = []
-    client.post(student_create_comment_url, student_comment_dict)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(student_create_comment_url, student_comment_dict)
     unread_msgs_for_teacher1 = (AssignmentNotification.objects
                                 .filter(is_about_passed=False,
                                         user=teacher1,
@@ -139,7 +142,8 @@ def test_view_new_assignment(client):
         'solution-text': "Test student solution without file"
     }
     mail.outbox = []
-    client.post(student_create_solution_url, solution_form)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(student_create_solution_url, solution_form)
     assert 2 == (AssignmentNotification.objects
                  .filter(is_about_passed=True,
                          is_unread=True,
@@ -207,7 +211,7 @@ def test_assignment_setup_assignees_public_form(client):
 
 
 @pytest.mark.django_db
-def test_assignment_submission_notifications_for_teacher(client):
+def test_assignment_submission_notifications_for_teacher(client, django_capture_on_commit_callbacks):
     course = CourseFactory()
     course_teacher1, *rest_course_teachers = CourseTeacherFactory.create_batch(4,
                                                                                course=course,
@@ -225,8 +229,9 @@ def test_assignment_submission_notifications_for_teacher(client):
     student_assignment = StudentAssignmentFactory(student=student, assignment=assignment)
     student_create_comment_url = reverse("study:assignment_comment_create",
                                          kwargs={"pk": student_assignment.pk})
-    client.post(student_create_comment_url,
-                {'comment-text': 'test first comment'})
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(student_create_comment_url,
+                    {'comment-text': 'test first comment'})
     notifications = [n.user.pk for n in AssignmentNotification.objects.all()]
     assert len(notifications) == 3
     assert course_teacher1.teacher_id not in notifications
@@ -325,7 +330,7 @@ def test_new_course_news_notification_context(settings):
 
 
 @pytest.mark.django_db
-def test_change_assignment_comment(settings):
+def test_change_assignment_comment(settings, django_capture_on_commit_callbacks):
     """Don't send notification on editing assignment comment"""
     teacher = TeacherFactory()
     course = CourseFactory(teachers=[teacher])
@@ -336,8 +341,9 @@ def test_change_assignment_comment(settings):
     student_assignment = StudentAssignment.objects.get(student=student,
                                                        assignment=assignment)
     assert AssignmentNotification.objects.count() == 1
-    comment = AssignmentCommentFactory(student_assignment=student_assignment,
-                                       author=teacher)
+    with django_capture_on_commit_callbacks(execute=True):
+        comment = AssignmentCommentFactory(student_assignment=student_assignment,
+                                           author=teacher)
     assert AssignmentNotification.objects.count() == 2
     comment.text = 'New Content'
     comment.save()
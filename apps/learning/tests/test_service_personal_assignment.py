@@ -155,7 +155,7 @@ def test_service_update_personal_assignment_stats_published(django_capture_on_co
 
 
 @pytest.mark.django_db
-def test_maybe_set_assignee_for_personal_assignment_already_assigned():
+def test_maybe_set_assignee_for_personal_assignment_already_assigned(django_capture_on_commit_callbacks):
     """Don't overwrite assignee if someone was set before student activity."""
     teacher1, teacher2 = TeacherFactory.create_batch(2)
     course = CourseFactory(teachers=[teacher1, teacher2])
@@ -172,15 +172,16 @@ def test_maybe_set_assignee_for_personal_assignment_already_assigned():
     student_assignment.assignee = course_teacher1
     student_assignment.save()
     # Leave a comment from the student
-    AssignmentCommentFactory(student_assignment=student_assignment,
-                             author=student)
+    with django_capture_on_commit_callbacks(execute=True):
+        AssignmentCommentFactory(student_assignment=student_assignment,
+                                 author=student)
     student_assignment.refresh_from_db()
     assert student_assignment.assignee == course_teacher1
     assert student_assignment.trigger_auto_assign is False
 
 
 @pytest.mark.django_db
-def test_maybe_set_assignee_for_personal_assignment():
+def test_maybe_set_assignee_for_personal_assignment(django_capture_on_commit_callbacks):
     student = StudentFactory()
     teacher1, teacher2 = TeacherFactory.create_batch(2)
     course = CourseFactory(teachers=[teacher1, teacher2])
@@ -189,8 +190,9 @@ def test_maybe_set_assignee_for_personal_assignment():
                                    assignee_mode=AssigneeMode.STUDENT_GROUP_DEFAULT)
     student_assignment = StudentAssignmentFactory(assignment=assignment, student=student)
     # Don't trigger on teacher's activity
-    comment1 = AssignmentCommentFactory(student_assignment=student_assignment,
-                                        author=teacher1)
+    with django_capture_on_commit_callbacks(execute=True):
+        comment1 = AssignmentCommentFactory(student_assignment=student_assignment,
+                                            author=teacher1)
     student_assignment.refresh_from_db()
     assert student_assignment.assignee is None
     assert student_assignment.trigger_auto_assign is True
@@ -198,8 +200,9 @@ def test_maybe_set_assignee_for_personal_assignment():
     enrollment = Enrollment.objects.get(student=comment1.student_assignment.student)
     StudentGroupAssigneeFactory(student_group=enrollment.student_group,
                                 assignee=course_teacher1)
-    comment2 = AssignmentCommentFactory(student_assignment=student_assignment,
-                                        author=student)
+    with django_capture_on_commit_callbacks(execute=True):
+        comment2 = AssignmentCommentFactory(student_assignment=student_assignment,
+                                            author=student)
     student_assignment.refresh_from_db()
     assert student_assignment.trigger_auto_assign is False
     assert student_assignment.assignee == course_teacher1
@@ -208,8 +211,9 @@ def test_maybe_set_assignee_for_personal_assignment():
     student_assignment.trigger_auto_assign = True
     student_assignment.assignee = None
     student_assignment.save()
-    comment3 = AssignmentCommentFactory(student_assignment=student_assignment,
-                                        author=student)
+    with django_capture_on_commit_callbacks(execute=True):
+        comment3 = AssignmentCommentFactory(student_assignment=student_assignment,
+                                            author=student)
     student_assignment.refresh_from_db()
     assert student_assignment.trigger_auto_assign is True
     # Multiple responsible teachers for the group
@@ -217,7 +221,8 @@ def test_maybe_set_assignee_for_personal_assignment():
                                 assignee=course_teacher2)
     enrollment.is_deleted = False
     enrollment.save()
-    AssignmentCommentFactory(student_assignment=student_assignment, author=student)
+    with django_capture_on_commit_callbacks(execute=True):
+        AssignmentCommentFactory(student_assignment=student_assignment, author=student)
     student_assignment.refresh_from_db()
     assert student_assignment.trigger_auto_assign is False
     assert student_assignment.assignee is None
@@ -228,7 +233,8 @@ def test_maybe_set_assignee_for_personal_assignment():
     student_assignment.trigger_auto_assign = True
     student_assignment.assignee = None
     student_assignment.save()
-    AssignmentCommentFactory(student_assignment=student_assignment, author=student)
+    with django_capture_on_commit_callbacks(execute=True):
+        AssignmentCommentFactory(student_assignment=student_assignment, author=student)
     student_assignment.refresh_from_db()
     assert student_assignment.trigger_auto_assign is False
     assert student_assignment.assignee is None
@@ -238,7 +244,8 @@ def test_maybe_set_assignee_for_personal_assignment():
     student_assignment.trigger_auto_assign = True
     student_assignment.assignee = None
     student_assignment.save()
-    AssignmentCommentFactory(student_assignment=student_assignment, author=student)
+    with django_capture_on_commit_callbacks(execute=True):
+        AssignmentCommentFactory(student_assignment=student_assignment, author=student)
     student_assignment.refresh_from_db()
     assert student_assignment.trigger_auto_assign is False
     assert student_assignment.assignee == course_teacher1
@@ -290,7 +297,7 @@ def test_update_personal_assignment_status(django_capture_on_commit_callbacks):
     with django_capture_on_commit_callbacks(execute=True) as callbacks:
         AssignmentCommentFactory(student_assignment=sa,
                                  type=AssignmentSubmissionTypes.SOLUTION)
-    assert len(callbacks) == 1
+    assert len(callbacks) == 2
     sa.refresh_from_db()
     # it changes status automatically
     assert sa.status == AssignmentStatus.ON_CHECKING
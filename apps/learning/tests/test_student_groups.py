@@ -46,6 +46,22 @@ def test_model_student_group_mutually_exclusive_fields(settings):
     student_group.full_clean()
 
 
+@pytest.mark.django_db
+def test_model_student_group_unique_name_case_insensitive(settings):
+    course = CourseFactory(group_mode=CourseGroupModes.MANUAL)
+    StudentGroupFactory(course=course, type=StudentGroupTypes.MANUAL, name='Test')
+    with pytest.raises(ValidationError) as e:
+        StudentGroupFactory(course=course, type=StudentGroupTypes.MANUAL, name='test')
+    program = AcademicProgramFactory()
+    StudentGroupFactory(course=course, type=StudentGroupTypes.PROGRAM,
+                        program=program, name='test')
+    with pytest.raises(ValidationError) as e:
+        StudentGroupFactory(course=course, type=StudentGroupTypes.PROGRAM,
+                            program=program, name='TEST')
+    other_course = CourseFactory(group_mode=CourseGroupModes.MANUAL)
+    StudentGroupFactory(course=other_course, type=StudentGroupTypes.MANUAL, name='test')
+
+
 @pytest.mark.django_db
 def test_create_default_student_group(settings):
     course = CourseFactory(group_mode=CourseGroupModes.MANUAL)
@@ -1,6 +1,8 @@
 import pytest
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from auth.mixins import PermissionRequiredMixin
 from core.timezone import now_local
@@ -115,3 +117,24 @@ def test_student_timetable(client):
     response = client.get(next_week_url)
     calendar = response.context_data['calendar']
     assert len(flatten_events(calendar)) == 2
+
+
+@pytest.mark.django_db
+def test_student_timetable_num_queries(client):
+    student_profile = StudentProfileFactory()
+    client.login(student_profile.user)
+    co = CourseFactory()
+    EnrollmentFactory.create(course=co, student_profile=student_profile,
+                             student=student_profile.user)
+    timetable_url = reverse('study:timetable')
+    today = now_local(settings.DEFAULT_TIMEZONE).date()
+    CourseClassFactory.create(course=co, date=today)
+    # Warm up caches populated on the first request
+    client.get(timetable_url)
+    with CaptureQueriesContext(connection) as queries:
+        client.get(timetable_url)
+    CourseClassFactory.create_batch(4, course=co, date=today)
+    with CaptureQueriesContext(connection) as more_queries:
+        response = client.get(timetable_url)
+    assert len(flatten_events(response.context_data['calendar'])) == 5
+    assert len(more_queries) == len(queries)
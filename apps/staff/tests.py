@@ -79,3 +79,19 @@ def test_view_student_faces(client):
     search(university_2, 2023, {student_profile_2023_2})
     search(university_2, 2024, set())
     search(university_2, 2025, {student_profile_2025})
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", [
+    "staff:staff_warehouse",
+    "staff:course_participants_intersection",
+    "staff:exports",
+    "staff:gradebook_list",
+    "course_list",
+])
+def test_view_staff_menu_pages(client, url_name):
+    SemesterFactory.create_current()
+    curator = CuratorFactory()
+    client.login(curator)
+    response = client.get(reverse(url_name))
+    assert response.status_code == 200
@@ -84,6 +84,7 @@ def get_student_profile(user: User, profile_type=None,
         filters.append(Q(type=profile_type))
     student_profile = (StudentProfile.objects
                        .filter(*filters, user=user)
+                       .select_related('academic_program_enrollment')
                        .order_by('priority', '-year_of_admission', '-pk')
                        .first())
     if student_profile is not None:
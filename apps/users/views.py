@@ -108,6 +108,7 @@ class UserDetailView(PermissionRequiredMixin, generic.TemplateView):
 
     def get_queryset(self, *args, **kwargs):
         enrollments_queryset = (Enrollment.active
+                                .with_grading_system()
                                 .select_related('course',
                                                 'course__semester',
                                                 'course__meta_course')
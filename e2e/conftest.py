@@ -4,15 +4,32 @@ Pytest configuration and fixtures for e2e tests with Playwright.
 
 import os
 import pytest
+from django.conf import settings
+from django.test import Client
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 
 # Allow synchronous Django ORM calls in this environment (Playwright might initialize an event loop)
 os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "true"
 
-# Import Django user factory for creating test users
+# Import Django factories for creating test data
+from apps.courses.tests.factories import (
+    CourseFactory,
+    MetaCourseFactory,
+    SemesterFactory,
+)
 from apps.users.tests.factories import UserFactory
 
 
+SKIPPED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+def _abort_skipped_resources(route):
+    if route.request.resource_type in SKIPPED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
 @pytest.fixture(scope="session")
 def playwright():
     """Playwright instance for the test session."""
@@ -27,24 +44,63 @@ def browser_type(playwright):
 
 
 @pytest.fixture(scope="session")
-def browser(playwright, browser_type):
-    """Browser instance for the test session."""
-    browser = browser_type.launch(
-        headless=False,
-        slow_mo=1000
-    )
+def browser_type_launch_args():
+    """
+    Keyword arguments passed to `browser_type.launch()`.
+
+    Browser runs headless by default, set `PLAYWRIGHT_HEADED=1` to watch
+    the tests locally.
+    """
+    headed = os.environ.get("PLAYWRIGHT_HEADED", "0") == "1"
+    return {
+        "headless": not headed,
+        "slow_mo": 1000 if headed else 0,
+        "args": ["--disable-dev-shm-usage", "--no-sandbox"],
+    }
+
+
+@pytest.fixture(scope="session")
+def browser(playwright, browser_type, browser_type_launch_args):
+    """
+    Browser instance shared by all tests of the session.
+
+    Session scope is per worker under pytest-xdist, each worker
+    launches the browser only once.
+    """
+    browser = browser_type.launch(**browser_type_launch_args)
     yield browser
     browser.close()
 
 
 @pytest.fixture
-def browser_context(browser):
-    """Browser context for each test."""
-    context = browser.new_context(
-        viewport={"width": 1920, "height": 1080},
-        ignore_https_errors=True,
-        locale="en-US",
-    )
+def browser_context_args():
+    """
+    Keyword arguments passed to `browser.new_context()`.
+
+    Override it to customize the context, e.g. to inject `storage_state`
+    of a logged in user.
+    """
+    return {
+        "viewport": {"width": 1920, "height": 1080},
+        "ignore_https_errors": True,
+        "locale": "en-US",
+    }
+
+
+@pytest.fixture
+def browser_context(browser, browser_context_args):
+    """
+    Browser context for each test.
+
+    Contexts are cheap compared to the browser launch and keep cookies
+    and storage of tests isolated. Images, fonts and media are not needed
+    for DOM assertions and are not loaded unless `PLAYWRIGHT_LOAD_ASSETS=1`
+    is set (e.g. to check the page visually). Stylesheets and scripts are
+    always kept since they affect visibility of elements.
+    """
+    context = browser.new_context(**browser_context_args)
+    if os.environ.get("PLAYWRIGHT_LOAD_ASSETS", "0") != "1":
+        context.route("**/*", _abort_skipped_resources)
     yield context
     context.close()
 
@@ -53,39 +109,70 @@ def browser_context(browser):
 def page(browser_context):
     """Page object for each test."""
     page = browser_context.new_page()
-    page.set_default_timeout(30000)  # 30 seconds
-    page.set_default_navigation_timeout(30000)
+    page.set_default_timeout(10000)  # 10 seconds
+    page.set_default_navigation_timeout(10000)
     yield page
     page.close()
 
 
-from e2e.pages.login_page import LoginPage
+@pytest.fixture
+def login_as(browser_context, live_server, django_db_blocker):
+    """
+    Returns a function that authenticates the browser context as a given user.
+
+    The session is created on the server side and its cookie is injected into
+    the context, which is much faster than filling in the login form.
+    Use the login form only in tests of the login flow itself.
+
+    Usage:
+        def test_something(page, login_as, base_url):
+            login_as(CuratorFactory())
+            page.goto(f"{base_url}/some-page")
+    """
+    def login(user):
+        client = Client()
+        with django_db_blocker.unblock():
+            client.force_login(user)
+        session_cookie = client.cookies[settings.SESSION_COOKIE_NAME]
+        browser_context.add_cookies([{
+            "name": settings.SESSION_COOKIE_NAME,
+            "value": session_cookie.value,
+            "url": live_server.url,
+        }])
+        return user
+    return login
+
 
 @pytest.fixture
-def authenticated_page(page: Page, live_server, django_db_blocker):
+def authenticated_page(page: Page, login_as, django_db_blocker):
     """
     Fixture that provides an authenticated page.
 
-    Creates a test user and logs in via the UI.
+    Creates a test user and logs in without going through the login form.
 
     Usage:
         def test_something(authenticated_page, base_url):
             authenticated_page.goto(f"{base_url}/some-page")
     """
-    # Create a test user using UserFactory
-    # UserFactory sets password to "test123foobar@!" and stores it in raw_password attribute
     # Use django_db_blocker to ensure synchronous access to Django ORM
     with django_db_blocker.unblock():
         user = UserFactory(username="testuser", email="test@example.com")
-        password = getattr(user, "raw_password", "test123foobar@!")
+    login_as(user)
+    return page
 
-    # Navigate to login page
-    login_page = LoginPage(page)
-    login_page.navigate(f"{live_server.url}/login/")
-    
-    login_page.login("testuser", password)
 
-    return page
+@pytest.fixture
+def seed_course(transactional_db):
+    """
+    Course "Test Course" of the autumn 2025 term with a fixed id, available
+    at `/courses/2025-autumn/3-some-slug/`.
+
+    Returns a dict with the created `meta_course`, `semester` and `course`.
+    """
+    meta_course = MetaCourseFactory(name="Test Course", slug="some-slug")
+    semester = SemesterFactory(year=2025, type="autumn")
+    course = CourseFactory(id=3, meta_course=meta_course, semester=semester)
+    return {"meta_course": meta_course, "semester": semester, "course": course}
 
 
 @pytest.fixture
@@ -1,14 +1,26 @@
-from playwright.sync_api import Page, Locator
+from playwright.sync_api import Page, Locator, expect
 
 class BasePage:
     def __init__(self, page: Page):
         self.page = page
 
     def navigate(self, url: str):
+        # `goto` returns after the load event, no need to wait for network idle
         self.page.goto(url)
-        self.page.wait_for_load_state("networkidle")
 
     def wait_for_url(self, url_pattern: str):
         self.page.wait_for_url(url_pattern)
 
+    def wait_until_ready(self, locator: Locator, timeout: float = 10000):
+        """Waits for the element the next step depends on instead of network idle."""
+        expect(locator.first).to_be_visible(timeout=timeout)
 
+    def follow_link(self, link: Locator):
+        """Clicks the link and waits until the target page is loaded."""
+        href = link.first.get_attribute("href")
+        # Fails fast on error responses instead of timing out on a locator
+        with self.page.expect_response(f"**{href}") as response_info:
+            link.first.click()
+        response = response_info.value
+        assert response.ok, f"{response.url} returned {response.status}"
+        self.page.wait_for_url(f"**{href}")
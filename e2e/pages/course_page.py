@@ -7,13 +7,11 @@ class CourseListPage(BasePage):
         self.courses_link = page.locator('a[href="/courses/"]')
     
     def go_to_courses(self):
-        self.courses_link.first.click()
-        self.page.wait_for_load_state("networkidle")
+        self.follow_link(self.courses_link)
 
     def go_to_course(self, course_name: str):
         course_link = self.page.locator(f'a.__course:has-text("{course_name}")')
-        course_link.first.click()
-        self.page.wait_for_load_state("networkidle")
+        self.follow_link(course_link)
 
 
 class CourseDetailPage(BasePage):
@@ -22,7 +20,6 @@ class CourseDetailPage(BasePage):
         self.add_assignment_button = page.locator('a.btn:has-text("Add assignment")')
         
     def go_to_add_assignment(self):
-        self.add_assignment_button.first.click()
-        self.page.wait_for_load_state("networkidle")
+        self.follow_link(self.add_assignment_button)
 
 
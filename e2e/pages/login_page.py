@@ -1,24 +1,31 @@
 from playwright.sync_api import Page, Locator
 from e2e.pages.base_page import BasePage
 
+USERNAME_SEL = '#id_username'
+PASSWORD_SEL = '#id_password'
+SUBMIT_SEL = '#sign-in input[type="submit"]'
+
+
 class LoginPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.username_input = page.locator('input[name="username"], input[type="text"][name*="user"], input[id*="username"], #id_username')
-        self.password_input = page.locator('input[name="password"], input[type="password"], #id_password')
-        self.submit_button = page.locator('button[type="submit"], input[type="submit"], button:has-text("SIGN IN"), button:has-text("Sign in")')
+    @property
+    def username_input(self) -> Locator:
+        return self.page.locator(USERNAME_SEL)
+
+    @property
+    def password_input(self) -> Locator:
+        return self.page.locator(PASSWORD_SEL)
+
+    @property
+    def submit_button(self) -> Locator:
+        return self.page.locator(SUBMIT_SEL)
 
     def login(self, username: str, password: str):
-        # Ensure elements are visible before interacting
-        if self.username_input.first.is_visible():
-             self.username_input.first.fill(username)
-        
-        if self.password_input.first.is_visible():
-            self.password_input.first.fill(password)
-            
-        if self.submit_button.first.is_visible():
-            self.submit_button.first.click()
-        
-        self.page.wait_for_load_state("networkidle")
+        # fill/click auto-wait for the elements to be actionable
+        self.username_input.fill(username)
+        self.password_input.fill(password)
+        self.submit_button.click()
+
+        # Successful login redirects away from the login page
+        self.page.wait_for_url(lambda url: "/login/" not in url)
 
 
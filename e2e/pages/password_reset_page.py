@@ -6,20 +6,20 @@ class PasswordResetPage(BasePage):
         super().__init__(page)
         self.forgot_password_link = page.locator('a[href="/password_reset/"]')
         self.password_recovery_heading = page.locator('h4:has-text("Password recovery")')
-        self.email_input = page.locator('#id_email, input[name="email"]')
-        self.restore_button = page.locator('input[type="submit"][value="Restore password"], button[type="submit"]')
+        self.email_input = page.locator('#id_email')
+        self.restore_button = page.locator('#reset-password input[type="submit"]')
         self.error_message = page.locator('.error-message')
 
     def go_to_forgot_password(self):
         self.forgot_password_link.first.click()
-        self.page.wait_for_load_state("networkidle")
+        self.wait_until_ready(self.password_recovery_heading)
 
     def fill_email(self, email: str):
-        self.email_input.first.fill(email)
+        self.email_input.fill(email)
 
     def submit_restore(self):
-        self.restore_button.first.click()
-        self.page.wait_for_load_state("networkidle")
+        # Outcome is checked by auto-waiting `verify_*` assertions
+        self.restore_button.click()
 
     def verify_recovery_heading_visible(self):
         expect(self.password_recovery_heading.first).to_be_visible()
@@ -18,7 +18,7 @@ from e2e.pages.course_page import CourseListPage, CourseDetailPage
 
 
 @pytest.mark.e2e
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True)
 def test_user_login_and_course_assignment_verification(page: Page, base_url):
     """Test user login flow and course assignment verification."""
     # Setup test data
@@ -29,12 +29,9 @@ def test_user_login_and_course_assignment_verification(page: Page, base_url):
     AssignmentFactory(course=course)
 
     # Create user with staff privileges
-    user = CuratorFactory(username="Aboba", email="aboba@test.com", is_staff=True)
-    password = getattr(user, "raw_password", "12345")
-    if password != "12345":
-        user.set_password("12345")
-        user.save()
-        password = "12345"
+    user = CuratorFactory(username="Aboba", email="aboba@test.com", is_staff=True,
+                          password="12345")
+    password = user.raw_password
 
     # Navigate to login page
     login_page = LoginPage(page)
@@ -10,7 +10,7 @@ from e2e.pages.password_reset_page import PasswordResetPage
 
 
 @pytest.mark.e2e
-@pytest.mark.django_db
+@pytest.mark.django_db(transaction=True)
 def test_password_reset_invalid_email_validation(page: Page, base_url):
     """Test password reset form validation with invalid email format."""
     # Navigate to login page
@@ -1,37 +1,32 @@
 """
-E2E test for staff user login, navigation, and gradebook access.
+E2E tests for staff user login, navigation, and gradebook access.
 """
 
 import pytest
 from playwright.sync_api import Page, expect
 
-from apps.courses.tests.factories import (
-    CourseFactory,
-    MetaCourseFactory,
-    SemesterFactory,
-)
 from apps.users.tests.factories import CuratorFactory
 from e2e.pages.login_page import LoginPage
-from e2e.pages.staff_page import StaffPage, GradebookPage
-from e2e.pages.course_page import CourseListPage
+from e2e.pages.staff_page import GradebookPage, StaffPage
 
+# Pages linked from the staff menu
+STAFF_MENU_URLS = [
+    "/staff/warehouse/",
+    "/staff/course-participants/",
+    "/staff/exports/",
+    "/staff/gradebooks/",
+    "/courses/",
+]
 
-@pytest.mark.e2e
-@pytest.mark.django_db
-def test_staff_login_navigation_and_gradebook_access(page: Page, base_url):
-    """Test staff user login flow, navigation through staff pages, and gradebook access."""
-    # Setup test data
-    meta_course = MetaCourseFactory(name="Test Course", slug="some-slug")
-    semester = SemesterFactory(year=2025, type="autumn")
-    _ = CourseFactory(id=3, meta_course=meta_course, semester=semester)
 
+@pytest.mark.e2e
+@pytest.mark.django_db(transaction=True)
+def test_staff_login(page: Page, base_url):
+    """Test staff user login flow."""
     # Create staff user
-    user = CuratorFactory(username="test_user", email="test@test.com", is_staff=True)
-    password = getattr(user, "raw_password", "12345")
-    if password != "12345":
-        user.set_password("12345")
-        user.save()
-        password = "12345"
+    user = CuratorFactory(username="test_user", email="test@test.com", is_staff=True,
+                          password="12345")
+    password = user.raw_password
 
     # Navigate to login page
     login_page = LoginPage(page)
@@ -41,34 +36,31 @@ def test_staff_login_navigation_and_gradebook_access(page: Page, base_url):
     # Assert successful login redirects to student search page
     expect(page).to_have_url(f"{base_url}/staff/student-search/")
 
-    staff_page = StaffPage(page)
 
-    # Resources navigation
-    staff_page.go_to_resources()
-    expect(page).to_have_url(f"{base_url}/staff/warehouse/")
+@pytest.mark.e2e
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("url", STAFF_MENU_URLS)
+def test_staff_menu_link(page: Page, base_url, login_as, seed_course, url):
+    """Test navigation from the staff menu, one link per test."""
+    login_as(CuratorFactory(is_staff=True))
+    staff_page = StaffPage(page)
+    staff_page.navigate(f"{base_url}/staff/student-search/")
 
-    # Overlaps navigation
-    staff_page.go_to_overlaps()
-    expect(page).to_have_url(f"{base_url}/staff/course-participants/")
+    staff_page.follow_link(page.locator(f'a[href="{url}"]'))
 
-    # Files navigation
-    staff_page.go_to_files()
-    expect(page).to_have_url(f"{base_url}/staff/exports/")
+    expect(page).to_have_url(f"{base_url}{url}")
 
-    # Gradebooks navigation
-    staff_page.go_to_gradebooks()
-    expect(page).to_have_url(f"{base_url}/staff/gradebooks/")
 
-    # Courses navigation
-    course_list_page = CourseListPage(page)
-    course_list_page.go_to_courses()
-    expect(page).to_have_url(f"{base_url}/courses/")
+@pytest.mark.e2e
+@pytest.mark.django_db(transaction=True)
+def test_staff_gradebook_access(page: Page, base_url, login_as, seed_course):
+    """Test opening a course gradebook from the gradebooks list."""
+    login_as(CuratorFactory(is_staff=True))
 
-    # Return to Gradebooks
-    staff_page.go_to_gradebooks()
+    gradebook_page = GradebookPage(page)
+    gradebook_page.navigate(f"{base_url}/staff/gradebooks/")
 
     # Click on Test Course in gradebooks list
-    gradebook_page = GradebookPage(page)
     gradebook_page.open_course_gradebook("Test Course")
 
     # Assert on gradebook page URL
@@ -127,6 +127,11 @@ WEBPACK_LOADER = {
 
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
 DATABASES = {"default": env.db_url(var="DATABASE_URL")}
+# Reuse connections across requests instead of reconnecting on each one
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DJANGO_DB_CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool(
+    "DJANGO_DB_CONN_HEALTH_CHECKS", default=True
+)
 
 
 MIDDLEWARE = [
@@ -3,7 +3,9 @@ from .base import *
 DEBUG = False
 
 # Override database to use SQLite for tests (no need for PostgreSQL permissions)
-# Use file-based SQLite instead of in-memory to allow proper migrations
+# NAME is used only outside of the test runner, TEST["NAME"] is not set so
+# the test database is created in memory with a shared cache
+# (file:memorydb_default?mode=memory&cache=shared), one per xdist worker
 import tempfile
 import os
 
@@ -11,6 +13,15 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": os.path.join(tempfile.gettempdir(), "lms_test_db.sqlite3"),
+        # Durability is not needed for test data. Exclusive locking mode is
+        # not used since live_server thread works with the same database
+        "OPTIONS": {
+            "init_command": (
+                "PRAGMA journal_mode=MEMORY;"
+                "PRAGMA synchronous=OFF;"
+                "PRAGMA temp_store=MEMORY;"
+            ),
+        },
     }
 }
 MODELTRANSLATION_DEBUG = False
@@ -91,7 +102,16 @@ STATICFILES_STORAGE = "django.contrib.staticfiles.storage.StaticFilesStorage"
 
 THUMBNAIL_KVSTORE = "sorl.thumbnail.kvstores.cached_db_kvstore.KVStore"
 
-SILENCED_SYSTEM_CHECKS = ["captcha.recaptcha_test_key_error"]
+SILENCED_SYSTEM_CHECKS = ["django_recaptcha.recaptcha_test_key_error"]
+
+# Base settings enable debug toolbar and verbose logging if DEBUG env
+# variable is set, tests run with DEBUG = False and need neither of them
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "debug_toolbar"]
+MIDDLEWARE = [m for m in MIDDLEWARE
+              if m != "debug_toolbar.middleware.DebugToolbarMiddleware"]
+for logger_config in LOGGING["loggers"].values():
+    if logger_config["level"] in ("DEBUG", "INFO"):
+        logger_config["level"] = "WARNING"
 
 for queue_config in RQ_QUEUES.values():
     queue_config["ASYNC"] = False